@@ -52,6 +52,9 @@ REQUIRED_CSV_COLUMNS = [
     "user_id"
 ]
 
+# Transaction dates are ISO formatted (YYYY-MM-DD)
+DATE_FORMAT = "%Y-%m-%d"
+
 # ============================================================================
 # Database Configuration
 # ============================================================================
@@ -91,6 +94,14 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 # Batch size for database inserts
 BATCH_SIZE = 1000
 
+# Bulk insert method: "copy" (COPY into a staging table) or "values" (execute_values)
+LOAD_METHOD = os.getenv("LOAD_METHOD", "copy")
+
+# Dimension tables loaded concurrently, each on its own connection (1 = serial,
+# single transaction). Dimension inserts are idempotent, so with more than one
+# worker each dimension commits independently before the fact load starts.
+DIMENSION_LOAD_WORKERS = int(os.getenv("DIMENSION_LOAD_WORKERS", "1"))
+
 # Enable data validation
 ENABLE_VALIDATION = True
 
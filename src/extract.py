@@ -14,11 +14,30 @@ from datetime import datetime
 import pandas as pd
 
 from src.logger import setup_logger
-from src.config import REQUIRED_CSV_COLUMNS
+from src.config import REQUIRED_CSV_COLUMNS, DATE_FORMAT
 
 # Set up logger for this module
 logger = setup_logger(__name__)
 
+# Use PyArrow's multithreaded CSV parser when available, otherwise pandas' C parser
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+# Column dtypes pinned at read time so both CSV engines return the same schema
+# (the PyArrow engine would otherwise infer 'date' as date objects)
+CSV_DTYPES = {"date": "str"}
+
+
+class MissingColumnsError(ValueError):
+    """Raised when the CSV file lacks required columns"""
+
+    def __init__(self, missing):
+        self.missing = frozenset(missing)
+        super().__init__(f"Missing required columns: {', '.join(sorted(self.missing))}")
+
 
 def get_file_info(file_path: str) -> dict:
     """
@@ -112,8 +131,9 @@ def extract_transactions(file_path: str) -> pd.DataFrame:
     1. Validates the file exists and is readable
     2. Reads the CSV file into a pandas DataFrame
     3. Performs structural validation
-    4. Logs extraction statistics
-    5. Returns the DataFrame for transformation
+    4. Parses the date column (when every value is an ISO date)
+    5. Logs extraction statistics
+    6. Returns the DataFrame for transformation
 
     Args:
         file_path: Path to the CSV file containing transaction data
@@ -125,7 +145,8 @@ def extract_transactions(file_path: str) -> pd.DataFrame:
         FileNotFoundError: If the file doesn't exist at the specified path
         pd.errors.EmptyDataError: If the CSV file is empty
         pd.errors.ParserError: If the CSV file is malformed
-        ValueError: If required columns are missing
+        MissingColumnsError: If required columns are missing (subclass of ValueError)
+        ValueError: If the CSV file has no data rows
         Exception: For any other unexpected errors
 
     Example:
@@ -154,9 +175,12 @@ def extract_transactions(file_path: str) -> pd.DataFrame:
         logger.info(f"Last modified: {file_info['modified_time']}")
 
         # Read CSV file
-        logger.info("Reading CSV file...")
+        logger.info(f"Reading CSV file (engine: {CSV_ENGINE})...")
         try:
-            df = pd.read_csv(file_path)
+            # The PyArrow engine reports empty files as ParserError, so detect them up front
+            if file_info["file_size"] == 0:
+                raise pd.errors.EmptyDataError("No columns to parse from file")
+            df = pd.read_csv(file_path, engine=CSV_ENGINE, dtype=CSV_DTYPES)
         except pd.errors.EmptyDataError as e:
             error_msg = f"CSV file is empty: {file_path}"
             logger.error(error_msg)
@@ -180,12 +204,27 @@ def extract_transactions(file_path: str) -> pd.DataFrame:
         is_valid, error_message = validate_csv_structure(df, REQUIRED_CSV_COLUMNS)
 
         if not is_valid:
+            missing_columns = set(REQUIRED_CSV_COLUMNS).difference(df.columns)
+            if missing_columns:
+                error = MissingColumnsError(missing_columns)
+                logger.error(f"CSV validation failed: {error}")
+                raise error
+
             error_msg = f"CSV validation failed: {error_message}"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
         logger.info("CSV structure validation passed")
 
+        # Parse dates once on the fixed-format fast path. If any value fails to
+        # parse, keep the raw strings so validation can report them as invalid.
+        parsed_dates = pd.to_datetime(df["date"], format=DATE_FORMAT, errors="coerce")
+        if parsed_dates.isna().sum() == df["date"].isna().sum():
+            df["date"] = parsed_dates
+            logger.info("Parsed 'date' column as datetime")
+        else:
+            logger.warning("Some 'date' values are not ISO dates; leaving column as text for validation")
+
         # Log data quality statistics
         null_counts = df.isnull().sum()
         columns_with_nulls = null_counts[null_counts > 0]
@@ -9,22 +9,49 @@ This module handles the load phase of the ETL process:
 - Loads fact table with duplicate prevention
 - Implements transaction management for data integrity
 - Provides incremental loading capabilities
-- Uses batch inserts for performance optimization
+- Uses PostgreSQL COPY into staging tables (or execute_values) for bulk loading
+- Streams Arrow record batches into the fact table for larger-than-memory loads
+- Optionally loads dimension tables concurrently on separate connections
 """
 
+import io
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, Iterable
+import numpy as np
 import pandas as pd
 import psycopg2
 from psycopg2 import sql
-from psycopg2.extras import execute_batch
+from psycopg2.extras import execute_values
+
+# PyArrow is only needed for the streaming fact loader
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
 from src.logger import setup_logger
-from src.config import DB_CONFIG, BATCH_SIZE
+from src.config import DB_CONFIG, BATCH_SIZE, LOAD_METHOD, DIMENSION_LOAD_WORKERS
 
 # Set up logger for this module
 logger = setup_logger(__name__)
 
+# Fact columns in fact_transactions column order
+FACT_COLUMNS = [
+    'transaction_id',
+    'date_key',
+    'category_key',
+    'merchant_key',
+    'payment_method_key',
+    'user_key',
+    'amount'
+]
+
+# Surrogate keys (and date_key) are INTEGER columns in the schema, so int32
+# holds them exactly and halves the bytes carried by the enriched fact frame
+SURROGATE_KEY_DTYPE = np.int32
+
 
 # ============================================================================
 # Custom Exceptions
@@ -128,6 +155,153 @@ def database_connection():
             logger.info("Database connection closed")
 
 
+# ============================================================================
+# Bulk Loading Helpers
+# ============================================================================
+
+def _copy_dataframe(cursor, df: pd.DataFrame, table_name: str, columns: list[str]) -> None:
+    """
+    Stream DataFrame columns into a table using COPY ... FROM STDIN.
+
+    Args:
+        cursor: Active database cursor
+        df: DataFrame containing the columns to copy
+        table_name: Target table name
+        columns: Ordered list of columns to copy
+    """
+    buffer = io.StringIO()
+    df[columns].to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+
+    copy_query = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV)"
+    cursor.copy_expert(copy_query, buffer)
+
+
+def _copy_insert(
+    cursor,
+    df: pd.DataFrame,
+    table_name: str,
+    columns: list[str],
+    conflict_column: str
+) -> int:
+    """
+    Bulk insert DataFrame rows through a temporary staging table.
+
+    Rows are copied into a staging table created with the target's column
+    types, then moved with INSERT ... SELECT ... ON CONFLICT DO NOTHING so
+    existing natural keys are skipped exactly as with row-wise inserts.
+
+    Args:
+        cursor: Active database cursor
+        df: DataFrame with rows to insert
+        table_name: Target table name
+        columns: Ordered list of columns to insert
+        conflict_column: Unique column used for duplicate prevention
+
+    Returns:
+        Number of rows actually inserted (conflicting rows excluded)
+    """
+    staging_table = f"stg_{table_name}"
+    columns_str = ', '.join(columns)
+
+    cursor.execute(f"""
+        CREATE TEMP TABLE {staging_table} AS
+        SELECT {columns_str} FROM {table_name} WITH NO DATA
+    """)
+
+    _copy_dataframe(cursor, df, staging_table, columns)
+
+    cursor.execute(f"""
+        INSERT INTO {table_name} ({columns_str})
+        SELECT {columns_str} FROM {staging_table}
+        ON CONFLICT ({conflict_column}) DO NOTHING
+    """)
+    # INSERT ... SELECT is a single statement, so rowcount is the inserted total
+    inserted_count = cursor.rowcount
+
+    cursor.execute(f"DROP TABLE {staging_table}")
+
+    return inserted_count
+
+
+def _values_insert(
+    cursor,
+    df: pd.DataFrame,
+    table_name: str,
+    columns: list[str],
+    conflict_column: str
+) -> int:
+    """
+    Bulk insert DataFrame rows with multi-row INSERT ... VALUES statements.
+
+    Uses psycopg2.extras.execute_values, which sends one statement per page of
+    BATCH_SIZE rows instead of one statement per row. Each page RETURNs a
+    marker per inserted row, since cursor.rowcount only reflects the last page.
+
+    Args:
+        cursor: Active database cursor
+        df: DataFrame with rows to insert
+        table_name: Target table name
+        columns: Ordered list of columns to insert
+        conflict_column: Unique column used for duplicate prevention
+
+    Returns:
+        Number of rows actually inserted (conflicting rows excluded)
+    """
+    insert_query = f"""
+        INSERT INTO {table_name} ({', '.join(columns)})
+        VALUES %s
+        ON CONFLICT ({conflict_column}) DO NOTHING
+        RETURNING 1
+    """
+
+    # itertuples already yields native Python scalars for NumPy-backed columns;
+    # only extension dtypes (e.g. nullable Int64) need an object cast to unbox
+    subset = df[columns]
+    extension_columns = {
+        col: object for col, dtype in subset.dtypes.items()
+        if isinstance(dtype, pd.api.extensions.ExtensionDtype)
+    }
+    if extension_columns:
+        subset = subset.astype(extension_columns)
+    records = subset.itertuples(index=False, name=None)
+
+    inserted_rows = execute_values(cursor, insert_query, records, page_size=BATCH_SIZE, fetch=True)
+
+    return len(inserted_rows)
+
+
+def _bulk_insert(
+    cursor,
+    df: pd.DataFrame,
+    table_name: str,
+    columns: list[str],
+    conflict_column: str
+) -> int:
+    """
+    Bulk insert DataFrame rows using the configured LOAD_METHOD.
+
+    Args:
+        cursor: Active database cursor
+        df: DataFrame with rows to insert
+        table_name: Target table name
+        columns: Ordered list of columns to insert
+        conflict_column: Unique column used for duplicate prevention
+
+    Returns:
+        Number of rows actually inserted (conflicting rows excluded)
+
+    Raises:
+        ValueError: If LOAD_METHOD is not 'copy' or 'values'
+    """
+    if LOAD_METHOD == 'copy':
+        return _copy_insert(cursor, df, table_name, columns, conflict_column)
+    elif LOAD_METHOD == 'values':
+        return _values_insert(cursor, df, table_name, columns, conflict_column)
+    else:
+        raise ValueError(f"Unknown LOAD_METHOD '{LOAD_METHOD}' (expected 'copy' or 'values')")
+
+
 # ============================================================================
 # Dimension Loading Functions
 # ============================================================================
@@ -142,7 +316,8 @@ def load_dimension(
     """
     Load dimension table with duplicate prevention.
 
-    Uses INSERT ... ON CONFLICT DO NOTHING for idempotency.
+    Bulk inserts rows (by default via COPY into a staging table, see
+    LOAD_METHOD) with ON CONFLICT DO NOTHING for idempotency.
     Only inserts new records; existing records are skipped.
 
     Args:
@@ -178,37 +353,11 @@ def load_dimension(
         if additional_columns:
             columns.extend(additional_columns)
 
-        # Build INSERT query with ON CONFLICT
-        columns_str = ', '.join(columns)
-        placeholders = ', '.join(['%s'] * len(columns))
-
-        insert_query = f"""
-            INSERT INTO {table_name} ({columns_str})
-            VALUES ({placeholders})
-            ON CONFLICT ({natural_key_column}) DO NOTHING
-        """
-
-        # Prepare data for insertion (convert numpy types to native Python types)
-        records = []
-        for _, row in df.iterrows():
-            values = tuple(row[col].item() if hasattr(row[col], 'item') else row[col] for col in columns)
-            records.append(values)
-
-        # Get count before insert
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        count_before = cursor.fetchone()[0]
-
-        # Execute batch insert
-        execute_batch(cursor, insert_query, records, page_size=BATCH_SIZE)
-
-        # Get count after insert
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        count_after = cursor.fetchone()[0]
-
-        inserted = count_after - count_before
+        # Bulk insert (COPY or execute_values, per LOAD_METHOD); the insert
+        # reports its own row count, so no COUNT(*) round-trips are needed
+        inserted = _bulk_insert(cursor, df, table_name, columns, natural_key_column)
 
         logger.info(f"  Inserted {inserted} new records (skipped {len(df) - inserted} existing)")
-        logger.info(f"  Total records in {table_name}: {count_after}")
 
         cursor.close()
         return inserted
@@ -247,49 +396,17 @@ def load_dim_date(conn, df: pd.DataFrame) -> int:
     try:
         cursor = conn.cursor()
 
-        # Build INSERT query with all date attributes
-        insert_query = """
-            INSERT INTO dim_date (
-                date_key, date, year, quarter, month, day,
-                month_name, day_name, day_of_week, week_of_year, is_weekend
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (date_key) DO NOTHING
-        """
-
-        # Prepare records
-        records = []
-        for _, row in df.iterrows():
-            values = (
-                int(row['date_key']),
-                row['date'],
-                int(row['year']),
-                int(row['quarter']),
-                int(row['month']),
-                int(row['day']),
-                row['month_name'],
-                row['day_name'],
-                int(row['day_of_week']),
-                int(row['week_of_year']),
-                bool(row['is_weekend'])
-            )
-            records.append(values)
-
-        # Get count before insert
-        cursor.execute("SELECT COUNT(*) FROM dim_date")
-        count_before = cursor.fetchone()[0]
+        # All date attributes in dim_date column order
+        columns = [
+            'date_key', 'date', 'year', 'quarter', 'month', 'day',
+            'month_name', 'day_name', 'day_of_week', 'week_of_year', 'is_weekend'
+        ]
 
-        # Execute batch insert
-        execute_batch(cursor, insert_query, records, page_size=BATCH_SIZE)
-
-        # Get count after insert
-        cursor.execute("SELECT COUNT(*) FROM dim_date")
-        count_after = cursor.fetchone()[0]
-
-        inserted = count_after - count_before
+        # Bulk insert (COPY or execute_values, per LOAD_METHOD); the insert
+        # reports its own row count, so no COUNT(*) round-trips are needed
+        inserted = _bulk_insert(cursor, df, 'dim_date', columns, 'date_key')
 
         logger.info(f"  Inserted {inserted} new date records (skipped {len(df) - inserted} existing)")
-        logger.info(f"  Total records in dim_date: {count_after}")
 
         cursor.close()
         return inserted
@@ -365,10 +482,14 @@ def get_dimension_key_mapping(
         raise DimensionLoadError(error_msg) from e
 
 
-def get_all_dimension_mappings(conn) -> dict[str, dict]:
+def get_all_dimension_mappings(conn) -> dict[str, dict | tuple[np.ndarray, np.ndarray]]:
     """
     Retrieve all dimension key mappings at once.
 
+    The integer-keyed user and date mappings are returned as sorted
+    (natural keys, surrogate keys) int64 arrays so enrich_fact_with_keys
+    can resolve them with a binary search.
+
     Args:
         conn: Active database connection
 
@@ -378,8 +499,8 @@ def get_all_dimension_mappings(conn) -> dict[str, dict]:
             'category': {natural_key: surrogate_key, ...},
             'merchant': {natural_key: surrogate_key, ...},
             'payment_method': {natural_key: surrogate_key, ...},
-            'user': {natural_key: surrogate_key, ...},
-            'date': {natural_key: surrogate_key, ...}
+            'user': (sorted user_ids, user_keys),
+            'date': (sorted date_keys, date_keys)
         }
 
     Example:
@@ -406,14 +527,14 @@ def get_all_dimension_mappings(conn) -> dict[str, dict]:
     )
 
     # User mapping
-    mappings['user'] = get_dimension_key_mapping(
+    mappings['user'] = _sorted_int_mapping(get_dimension_key_mapping(
         conn, 'dim_user', 'user_id', 'user_key'
-    )
+    ))
 
     # Date mapping (using date_key which is already an integer)
-    mappings['date'] = get_dimension_key_mapping(
+    mappings['date'] = _sorted_int_mapping(get_dimension_key_mapping(
         conn, 'dim_date', 'date_key', 'date_key'
-    )
+    ))
 
     logger.info("All dimension key mappings retrieved successfully")
 
@@ -424,9 +545,98 @@ def get_all_dimension_mappings(conn) -> dict[str, dict]:
 # Fact Data Enrichment
 # ============================================================================
 
+def _lookup_surrogate_keys(
+    values: pd.Series,
+    mapping: dict | tuple[np.ndarray, np.ndarray]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized lookup of surrogate keys for a column of natural keys.
+
+    Accepts either mapping form:
+    - dict: resolves every value to its position in the mapping's keys with a
+      single hash-table pass (pd.Index.get_indexer), then gathers surrogate keys
+      from a contiguous int64 array instead of probing the dict row by row
+    - (sorted_keys, values) arrays: binary-searches the sorted keys with
+      np.searchsorted; identity mappings (e.g. date_key -> date_key) skip the
+      gather and reuse the input values directly
+
+    Categorical values are resolved once per category and then gathered by
+    code, so the per-row work is a single integer take.
+
+    Args:
+        values: Series of natural keys
+        mapping: Dictionary mapping natural keys to surrogate keys, or a tuple of
+            (sorted natural keys, surrogate keys) NumPy arrays
+
+    Returns:
+        Tuple of (surrogate_keys, missing_mask)
+        - surrogate_keys: int64 array (entries under missing_mask are undefined)
+        - missing_mask: Boolean array marking values absent from the mapping
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        category_keys, category_missing = _lookup_surrogate_keys(
+            pd.Series(values.cat.categories), mapping
+        )
+        codes = values.cat.codes.to_numpy()
+        if len(category_keys) == 0:
+            return np.zeros(len(values), dtype=np.int64), np.ones(len(values), dtype=bool)
+        return category_keys[codes], category_missing[codes] | (codes == -1)
+
+    if isinstance(mapping, tuple):
+        natural_keys, surrogate_keys = mapping
+        if len(natural_keys) == 0:
+            return np.zeros(len(values), dtype=np.int64), np.ones(len(values), dtype=bool)
+
+        query = values.to_numpy()
+        positions = np.minimum(np.searchsorted(natural_keys, query), len(natural_keys) - 1)
+        missing_mask = natural_keys[positions] != query
+
+        if np.array_equal(natural_keys, surrogate_keys):
+            return query.astype(np.int64, copy=False), missing_mask
+        return np.asarray(surrogate_keys, dtype=np.int64)[positions], missing_mask
+
+    positions = pd.Index(list(mapping.keys())).get_indexer(values)
+    missing_mask = positions == -1
+
+    surrogate_keys = np.fromiter(mapping.values(), dtype=np.int64, count=len(mapping))
+    if len(surrogate_keys) == 0:
+        return np.zeros(len(values), dtype=np.int64), missing_mask
+
+    return surrogate_keys[positions], missing_mask
+
+
+def _sorted_int_mapping(
+    mapping: dict | tuple[np.ndarray, np.ndarray]
+) -> dict | tuple[np.ndarray, np.ndarray]:
+    """
+    Convert an integer-keyed dict mapping to sorted (keys, values) int64 arrays.
+
+    Integer natural keys (user_id, date_key) can then be resolved with
+    np.searchsorted in _lookup_surrogate_keys. Mappings that are already
+    arrays, or whose keys are not integers, are returned unchanged.
+
+    Args:
+        mapping: Dictionary mapping natural keys to surrogate keys, or a tuple of arrays
+
+    Returns:
+        Tuple of (sorted natural keys, surrogate keys) arrays, or the original mapping
+    """
+    if not isinstance(mapping, dict):
+        return mapping
+
+    try:
+        natural_keys = np.fromiter(mapping.keys(), dtype=np.int64, count=len(mapping))
+    except (TypeError, ValueError):
+        return mapping
+
+    surrogate_keys = np.fromiter(mapping.values(), dtype=np.int64, count=len(mapping))
+    order = np.argsort(natural_keys, kind='stable')
+    return natural_keys[order], surrogate_keys[order]
+
+
 def enrich_fact_with_keys(
     fact_df: pd.DataFrame,
-    dimension_mappings: dict[str, dict]
+    dimension_mappings: dict[str, dict | tuple[np.ndarray, np.ndarray]]
 ) -> pd.DataFrame:
     """
     Replace natural keys with surrogate keys from dimensions.
@@ -436,7 +646,8 @@ def enrich_fact_with_keys(
 
     Args:
         fact_df: Fact data with natural keys (category, merchant, etc.)
-        dimension_mappings: Dict of dicts for each dimension mapping
+        dimension_mappings: Mapping per dimension, either a dict of
+            natural key -> surrogate key or a (sorted_keys, values) tuple of arrays
 
     Returns:
         DataFrame with surrogate keys (_key columns) added
@@ -457,61 +668,61 @@ def enrich_fact_with_keys(
         initial_count = len(enriched_df)
 
         # Map category to category_key
-        enriched_df['category_key'] = enriched_df['category'].map(dimension_mappings['category'])
-        missing_categories = enriched_df['category_key'].isnull().sum()
+        category_keys, missing = _lookup_surrogate_keys(enriched_df['category'], dimension_mappings['category'])
+        missing_categories = missing.sum()
         if missing_categories > 0:
-            missing_values = enriched_df[enriched_df['category_key'].isnull()]['category'].unique()
+            missing_values = np.asarray(enriched_df.loc[missing, 'category'].unique())
             error_msg = f"Found {missing_categories} transactions with unmapped categories: {missing_values[:5]}"
             logger.error(error_msg)
             raise FactLoadError(error_msg)
+        enriched_df['category_key'] = category_keys.astype(SURROGATE_KEY_DTYPE)
 
         # Map merchant to merchant_key
-        enriched_df['merchant_key'] = enriched_df['merchant'].map(dimension_mappings['merchant'])
-        missing_merchants = enriched_df['merchant_key'].isnull().sum()
+        merchant_keys, missing = _lookup_surrogate_keys(enriched_df['merchant'], dimension_mappings['merchant'])
+        missing_merchants = missing.sum()
         if missing_merchants > 0:
-            missing_values = enriched_df[enriched_df['merchant_key'].isnull()]['merchant'].unique()
+            missing_values = np.asarray(enriched_df.loc[missing, 'merchant'].unique())
             error_msg = f"Found {missing_merchants} transactions with unmapped merchants: {missing_values[:5]}"
             logger.error(error_msg)
             raise FactLoadError(error_msg)
+        enriched_df['merchant_key'] = merchant_keys.astype(SURROGATE_KEY_DTYPE)
 
         # Map payment_method to payment_method_key
-        enriched_df['payment_method_key'] = enriched_df['payment_method'].map(
-            dimension_mappings['payment_method']
+        payment_method_keys, missing = _lookup_surrogate_keys(
+            enriched_df['payment_method'], dimension_mappings['payment_method']
         )
-        missing_payment = enriched_df['payment_method_key'].isnull().sum()
+        missing_payment = missing.sum()
         if missing_payment > 0:
-            missing_values = enriched_df[enriched_df['payment_method_key'].isnull()]['payment_method'].unique()
+            missing_values = np.asarray(enriched_df.loc[missing, 'payment_method'].unique())
             error_msg = f"Found {missing_payment} transactions with unmapped payment methods: {missing_values}"
             logger.error(error_msg)
             raise FactLoadError(error_msg)
+        enriched_df['payment_method_key'] = payment_method_keys.astype(SURROGATE_KEY_DTYPE)
 
         # Map user_id to user_key
-        enriched_df['user_key'] = enriched_df['user_id'].map(dimension_mappings['user'])
-        missing_users = enriched_df['user_key'].isnull().sum()
+        user_keys, missing = _lookup_surrogate_keys(
+            enriched_df['user_id'], _sorted_int_mapping(dimension_mappings['user'])
+        )
+        missing_users = missing.sum()
         if missing_users > 0:
-            missing_values = enriched_df[enriched_df['user_key'].isnull()]['user_id'].unique()
+            missing_values = enriched_df.loc[missing, 'user_id'].unique()
             error_msg = f"Found {missing_users} transactions with unmapped user_ids: {missing_values[:5]}"
             logger.error(error_msg)
             raise FactLoadError(error_msg)
+        enriched_df['user_key'] = user_keys.astype(SURROGATE_KEY_DTYPE)
 
         # Date_key is already in the correct format (YYYYMMDD integer)
         # Just verify it exists in the date dimension
-        enriched_df['date_key_exists'] = enriched_df['date_key'].isin(dimension_mappings['date'].keys())
-        missing_dates = (~enriched_df['date_key_exists']).sum()
+        _, missing = _lookup_surrogate_keys(
+            enriched_df['date_key'], _sorted_int_mapping(dimension_mappings['date'])
+        )
+        missing_dates = missing.sum()
         if missing_dates > 0:
-            missing_values = enriched_df[~enriched_df['date_key_exists']]['date_key'].unique()
+            missing_values = enriched_df.loc[missing, 'date_key'].unique()
             error_msg = f"Found {missing_dates} transactions with unmapped date_keys: {missing_values[:5]}"
             logger.error(error_msg)
             raise FactLoadError(error_msg)
-
-        # Drop the temporary validation column
-        enriched_df = enriched_df.drop(columns=['date_key_exists'])
-
-        # Convert surrogate keys to integers
-        enriched_df['category_key'] = enriched_df['category_key'].astype(int)
-        enriched_df['merchant_key'] = enriched_df['merchant_key'].astype(int)
-        enriched_df['payment_method_key'] = enriched_df['payment_method_key'].astype(int)
-        enriched_df['user_key'] = enriched_df['user_key'].astype(int)
+        enriched_df['date_key'] = enriched_df['date_key'].astype(SURROGATE_KEY_DTYPE)
 
         logger.info(f"Successfully enriched {len(enriched_df)} fact records with surrogate keys")
         logger.info(f"  Added columns: category_key, merchant_key, payment_method_key, user_key")
@@ -531,11 +742,18 @@ def enrich_fact_with_keys(
 # Fact Table Loading Functions
 # ============================================================================
 
+# Rows fetched per round-trip when streaming existing IDs from the server
+EXISTING_ID_FETCH_SIZE = 50_000
+
+
 def check_existing_transactions(conn, transaction_ids: list) -> set:
     """
     Query database to find which transactions already exist.
 
     Enables incremental loading by identifying duplicate transactions.
+    The incoming IDs are copied into a temporary table and matched with a
+    server-side EXISTS semi-join, so only the overlapping IDs are returned
+    instead of sending a large array parameter with every query.
 
     Args:
         conn: Active database connection
@@ -557,15 +775,46 @@ def check_existing_transactions(conn, transaction_ids: list) -> set:
 
         cursor = conn.cursor()
 
-        # Use ANY to check multiple values efficiently
+        # Stage incoming IDs server-side. On an autocommit connection a failed
+        # earlier call leaves its temp table behind, so drop any leftover first
+        cursor.execute("DROP TABLE IF EXISTS incoming_transaction_ids")
+        cursor.execute("""
+            CREATE TEMP TABLE incoming_transaction_ids (transaction_id VARCHAR(50))
+        """)
+        _copy_dataframe(
+            cursor,
+            pd.DataFrame({'transaction_id': transaction_ids}),
+            'incoming_transaction_ids',
+            ['transaction_id']
+        )
+
+        # Anti-duplicate lookup using the fact table's unique index
         query = """
-            SELECT transaction_id
-            FROM fact_transactions
-            WHERE transaction_id = ANY(%s)
+            SELECT i.transaction_id
+            FROM incoming_transaction_ids i
+            WHERE EXISTS (
+                SELECT 1
+                FROM fact_transactions f
+                WHERE f.transaction_id = i.transaction_id
+            )
         """
 
-        cursor.execute(query, (transaction_ids,))
-        existing_ids = {row[0] for row in cursor.fetchall()}
+        # Stream matches through a server-side cursor so client memory stays
+        # bounded by the fetch size rather than the number of existing IDs.
+        # Named cursors only work inside a transaction, so autocommit
+        # connections fall back to a regular client-side cursor.
+        if conn.autocommit:
+            select_cursor = conn.cursor()
+        else:
+            select_cursor = conn.cursor(name='existing_transaction_ids')
+        select_cursor.execute(query)
+
+        existing_ids = set()
+        while batch := select_cursor.fetchmany(EXISTING_ID_FETCH_SIZE):
+            existing_ids.update(row[0] for row in batch)
+        select_cursor.close()
+
+        cursor.execute("DROP TABLE incoming_transaction_ids")
 
         logger.info(f"  Found {len(existing_ids)} existing transactions")
 
@@ -591,6 +840,9 @@ def load_fact_table(
     Load fact table with duplicate prevention.
 
     Uses transaction_id to avoid inserting duplicate records.
+    Duplicate transaction_ids within the batch are collapsed client-side
+    (first occurrence wins, as in the transform step) before anything is
+    sent to the database.
     Supports incremental loading by checking for existing transactions.
 
     Args:
@@ -618,16 +870,23 @@ def load_fact_table(
 
         cursor = conn.cursor()
 
+        # Collapse duplicate transaction_ids within the batch, keeping the first
+        # row like transform's duplicated(keep='first')
+        unique_df = fact_df.drop_duplicates(subset='transaction_id', keep='first')
+        duplicate_count = len(fact_df) - len(unique_df)
+        if duplicate_count:
+            logger.info(f"  Dropped {duplicate_count} duplicate transaction_ids within the batch")
+
         # Check for existing transactions
-        transaction_ids = fact_df['transaction_id'].tolist()
+        transaction_ids = unique_df['transaction_id'].tolist()
         existing_ids = check_existing_transactions(conn, transaction_ids)
 
         # Filter out existing transactions
         if existing_ids:
             logger.info(f"  Filtering out {len(existing_ids)} existing transactions")
-            new_transactions_df = fact_df[~fact_df['transaction_id'].isin(existing_ids)].copy()
+            new_transactions_df = unique_df[~unique_df['transaction_id'].isin(existing_ids)]
         else:
-            new_transactions_df = fact_df.copy()
+            new_transactions_df = unique_df
 
         skipped_count = len(fact_df) - len(new_transactions_df)
 
@@ -636,66 +895,235 @@ def load_fact_table(
             cursor.close()
             return 0, skipped_count
 
-        # Build INSERT query
-        insert_query = """
-            INSERT INTO fact_transactions (
-                transaction_id,
-                date_key,
-                category_key,
-                merchant_key,
-                payment_method_key,
-                user_key,
-                amount
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (transaction_id) DO NOTHING
-        """
+        columns = FACT_COLUMNS
 
-        # Prepare records for insertion
-        records = []
-        for _, row in new_transactions_df.iterrows():
-            values = (
-                str(row['transaction_id']),
-                int(row['date_key']),
-                int(row['category_key']),
-                int(row['merchant_key']),
-                int(row['payment_method_key']),
-                int(row['user_key']),
-                float(row['amount'])
-            )
-            records.append(values)
+        # Bulk insert (COPY or execute_values, per LOAD_METHOD); the insert
+        # reports its own row count, so no COUNT(*) round-trips are needed
+        logger.info(f"  Inserting {len(new_transactions_df)} new transactions (method: {LOAD_METHOD})...")
+        inserted_count = _bulk_insert(cursor, new_transactions_df, table_name, columns, 'transaction_id')
+
+        # Rows that lost an ON CONFLICT race since the existence check count as skipped
+        skipped_count += len(new_transactions_df) - inserted_count
+
+        logger.info(f"  Successfully inserted {inserted_count} new transactions")
+        logger.info(f"  Skipped {skipped_count} existing or duplicate transactions")
+
+        cursor.close()
+        return inserted_count, skipped_count
+
+    except psycopg2.Error as e:
+        error_msg = f"Failed to load fact table {table_name}: {str(e)}"
+        logger.error(error_msg)
+        raise FactLoadError(error_msg) from e
+    except Exception as e:
+        error_msg = f"Unexpected error loading fact table {table_name}: {str(e)}"
+        logger.error(error_msg)
+        raise FactLoadError(error_msg) from e
+
+
+def load_fact_table_stream(
+    conn,
+    batches: Iterable["pa.RecordBatch"],
+    table_name: str = 'fact_transactions'
+) -> tuple[int, int]:
+    """
+    Load enriched fact rows from a stream of Arrow record batches.
+
+    Each batch is written as CSV straight from Arrow buffers and COPYed into
+    a temporary staging table as it arrives, so client memory stays bounded
+    by the batch size. A single INSERT ... SELECT ... ON CONFLICT DO NOTHING
+    then moves the staged rows into the fact table, skipping transaction_ids
+    that already exist (or repeat across batches).
+
+    Args:
+        conn: Active database connection
+        batches: Iterable of record batches containing the FACT_COLUMNS
+        table_name: Name of fact table (default: 'fact_transactions')
+
+    Returns:
+        Tuple of (inserted_count, skipped_count)
+
+    Raises:
+        FactLoadError: If fact loading fails or PyArrow is not installed
+
+    Example:
+        >>> table = pa.Table.from_pandas(enriched_df)
+        >>> inserted, skipped = load_fact_table_stream(conn, table.to_batches(50_000))
+    """
+    if pa is None:
+        raise FactLoadError("Streaming fact load requires pyarrow to be installed")
+
+    staging_table = f"stg_{table_name}"
+    columns_str = ', '.join(FACT_COLUMNS)
+
+    try:
+        logger.info(f"Streaming {table_name}...")
+
+        cursor = conn.cursor()
 
-        # Get count before insert
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        count_before = cursor.fetchone()[0]
+        cursor.execute(f"""
+            CREATE TEMP TABLE {staging_table} AS
+            SELECT {columns_str} FROM {table_name} WITH NO DATA
+        """)
 
-        # Execute batch insert
-        logger.info(f"  Inserting {len(records)} new transactions in batches of {BATCH_SIZE}...")
-        execute_batch(cursor, insert_query, records, page_size=BATCH_SIZE)
+        # Stage each batch as it arrives
+        copy_query = f"COPY {staging_table} ({columns_str}) FROM STDIN WITH (FORMAT CSV, HEADER)"
+        staged_count = 0
+        batch_count = 0
 
-        # Get count after insert
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        count_after = cursor.fetchone()[0]
+        for batch in batches:
+            if batch.num_rows == 0:
+                continue
 
-        inserted_count = count_after - count_before
+            buffer = io.BytesIO()
+            pa_csv.write_csv(pa.Table.from_batches([batch]).select(FACT_COLUMNS), buffer)
+            buffer.seek(0)
+            cursor.copy_expert(copy_query, buffer)
+
+            staged_count += batch.num_rows
+            batch_count += 1
+
+        logger.info(f"  Staged {staged_count} records in {batch_count} batches")
+
+        # INSERT ... SELECT is a single statement, so rowcount is the inserted
+        # total (conflicting rows excluded); no COUNT(*) scans are needed
+        cursor.execute(f"""
+            INSERT INTO {table_name} ({columns_str})
+            SELECT {columns_str} FROM {staging_table}
+            ON CONFLICT (transaction_id) DO NOTHING
+        """)
+        inserted_count = cursor.rowcount
+
+        cursor.execute(f"DROP TABLE {staging_table}")
+
+        skipped_count = staged_count - inserted_count
 
         logger.info(f"  Successfully inserted {inserted_count} new transactions")
-        logger.info(f"  Skipped {skipped_count} existing transactions")
-        logger.info(f"  Total records in {table_name}: {count_after}")
+        logger.info(f"  Skipped {skipped_count} existing or duplicate transactions")
 
         cursor.close()
         return inserted_count, skipped_count
 
     except psycopg2.Error as e:
-        error_msg = f"Failed to load fact table {table_name}: {str(e)}"
+        error_msg = f"Failed to stream fact table {table_name}: {str(e)}"
         logger.error(error_msg)
         raise FactLoadError(error_msg) from e
     except Exception as e:
-        error_msg = f"Unexpected error loading fact table {table_name}: {str(e)}"
+        error_msg = f"Unexpected error streaming fact table {table_name}: {str(e)}"
         logger.error(error_msg)
         raise FactLoadError(error_msg) from e
 
 
+# ============================================================================
+# Concurrent Dimension Loading
+# ============================================================================
+
+# (table name, natural key column) in load order; dim_date is keyed by date_key
+# and loaded with all of its attributes by load_dim_date
+DIMENSION_TABLES = [
+    ('dim_date', None),
+    ('dim_category', 'category_name'),
+    ('dim_merchant', 'merchant_name'),
+    ('dim_payment_method', 'payment_method_name'),
+    ('dim_user', 'user_id'),
+]
+
+
+def _load_one_dimension(conn, table_name: str, natural_key_column: str, df: pd.DataFrame) -> int:
+    """
+    Dispatch a dimension table to load_dim_date or load_dimension.
+
+    Args:
+        conn: Active database connection
+        table_name: Dimension table name
+        natural_key_column: Natural key column (None for dim_date)
+        df: Dimension DataFrame
+
+    Returns:
+        Number of new rows inserted
+    """
+    if natural_key_column is None:
+        return load_dim_date(conn, df)
+    return load_dimension(conn, df, table_name, natural_key_column)
+
+
+def _load_dimensions_serially(conn, transformed_data: dict[str, pd.DataFrame], counts: dict[str, int]) -> None:
+    """
+    Load all dimension tables in order on the caller's connection (single transaction).
+
+    Args:
+        conn: Active database connection
+        transformed_data: Output of transform_transactions
+        counts: Dictionary updated with inserted row counts per dimension table
+    """
+    for table_name, natural_key_column in DIMENSION_TABLES:
+        counts[table_name] = _load_one_dimension(
+            conn, table_name, natural_key_column, transformed_data[table_name]
+        )
+
+
+def _load_dimension_on_own_connection(table_name: str, natural_key_column: str, df: pd.DataFrame) -> int:
+    """
+    Load one dimension on a dedicated connection and commit it.
+
+    Args:
+        table_name: Dimension table name
+        natural_key_column: Natural key column (None for dim_date)
+        df: Dimension DataFrame
+
+    Returns:
+        Number of new rows inserted
+    """
+    with database_connection() as conn:
+        conn.autocommit = False
+        inserted = _load_one_dimension(conn, table_name, natural_key_column, df)
+        conn.commit()
+        logger.info(f"  Committed {table_name} on its own connection")
+        return inserted
+
+
+def load_dimensions_concurrently(
+    transformed_data: dict[str, pd.DataFrame],
+    max_workers: int = DIMENSION_LOAD_WORKERS
+) -> dict[str, int]:
+    """
+    Load all dimension tables in parallel threads, one connection each.
+
+    Dimension loads are independent network round-trips, so overlapping them
+    brings wall-clock time close to the slowest single dimension. Each
+    dimension commits on its own connection; because inserts use
+    ON CONFLICT DO NOTHING, re-running after a failure is safe.
+
+    Args:
+        transformed_data: Output of transform_transactions
+        max_workers: Maximum number of concurrent dimension loads
+
+    Returns:
+        Dictionary of inserted row counts keyed by dimension table name
+
+    Raises:
+        DimensionLoadError: If any dimension fails to load
+        DatabaseConnectionError: If a connection cannot be established
+
+    Example:
+        >>> counts = load_dimensions_concurrently(transformed_data, max_workers=5)
+        >>> print(counts['dim_category'])
+    """
+    logger.info(f"Loading {len(DIMENSION_TABLES)} dimension tables with {max_workers} workers...")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            table_name: executor.submit(
+                _load_dimension_on_own_connection,
+                table_name, natural_key_column, transformed_data[table_name]
+            )
+            for table_name, natural_key_column in DIMENSION_TABLES
+        }
+
+        # Barrier: wait for every dimension, re-raising the first failure
+        return {table_name: future.result() for table_name, future in futures.items()}
+
+
 # ============================================================================
 # Main Load Function
 # ============================================================================
@@ -713,8 +1141,12 @@ def load_data_warehouse(transformed_data: dict) -> dict:
     6. Loads fact table
     7. Commits transaction (or rolls back on error)
 
-    All operations are performed within a single database transaction
-    to ensure data consistency (atomicity).
+    With the default DIMENSION_LOAD_WORKERS=1, all operations are performed
+    within a single database transaction to ensure data consistency
+    (atomicity). With more than one worker, each dimension is loaded and
+    committed on its own connection before the fact load, so a later failure
+    rolls back only the fact load and leaves the new dimension rows committed
+    (dimension inserts are idempotent, so a re-run is safe).
 
     Args:
         transformed_data: Dictionary with keys:
@@ -792,42 +1224,10 @@ def load_data_warehouse(transformed_data: dict) -> dict:
         logger.info("STEP 1: Loading dimension tables...")
         logger.info("-" * 80)
 
-        # Load dim_date (with all attributes)
-        stats['dimensions_inserted']['dim_date'] = load_dim_date(
-            conn, transformed_data['dim_date']
-        )
-
-        # Load dim_category
-        stats['dimensions_inserted']['dim_category'] = load_dimension(
-            conn,
-            transformed_data['dim_category'],
-            'dim_category',
-            'category_name'
-        )
-
-        # Load dim_merchant
-        stats['dimensions_inserted']['dim_merchant'] = load_dimension(
-            conn,
-            transformed_data['dim_merchant'],
-            'dim_merchant',
-            'merchant_name'
-        )
-
-        # Load dim_payment_method
-        stats['dimensions_inserted']['dim_payment_method'] = load_dimension(
-            conn,
-            transformed_data['dim_payment_method'],
-            'dim_payment_method',
-            'payment_method_name'
-        )
-
-        # Load dim_user
-        stats['dimensions_inserted']['dim_user'] = load_dimension(
-            conn,
-            transformed_data['dim_user'],
-            'dim_user',
-            'user_id'
-        )
+        if DIMENSION_LOAD_WORKERS > 1:
+            stats['dimensions_inserted'] = load_dimensions_concurrently(transformed_data)
+        else:
+            _load_dimensions_serially(conn, transformed_data, stats['dimensions_inserted'])
 
         logger.info("All dimension tables loaded successfully")
 
@@ -9,11 +9,16 @@ This module handles the transformation phase of the ETL process:
 - Provides comprehensive error handling and logging
 """
 
+import logging
+import re
 from datetime import datetime
+from functools import singledispatch
 from typing import Any
+import numpy as np
 import pandas as pd
 
 from src.logger import setup_logger
+from src.config import DATE_FORMAT
 
 # Set up logger for this module
 logger = setup_logger(__name__)
@@ -22,14 +27,20 @@ logger = setup_logger(__name__)
 # Data Quality Configuration
 # ============================================================================
 
-ALLOWED_CATEGORIES = [
+# Ordered tuples define the categorical dtypes; frozensets serve membership checks
+ALLOWED_CATEGORIES_TUPLE = (
     'Groceries', 'Dining', 'Transportation', 'Entertainment',
     'Utilities', 'Shopping', 'Healthcare', 'Travel'
-]
+)
+ALLOWED_CATEGORIES: frozenset[str] = frozenset(ALLOWED_CATEGORIES_TUPLE)
 
-ALLOWED_PAYMENT_METHODS = [
+ALLOWED_PAYMENT_METHODS_TUPLE = (
     'Credit Card', 'Debit Card', 'Cash', 'Digital Wallet'
-]
+)
+ALLOWED_PAYMENT_METHODS: frozenset[str] = frozenset(ALLOWED_PAYMENT_METHODS_TUPLE)
+
+CATEGORY_DTYPE = pd.CategoricalDtype(ALLOWED_CATEGORIES_TUPLE)
+PAYMENT_METHOD_DTYPE = pd.CategoricalDtype(ALLOWED_PAYMENT_METHODS_TUPLE)
 
 MIN_VALID_DATE = datetime(2020, 1, 1)  # Not before 2020
 MAX_VALID_DATE = datetime.now()  # Not in future
@@ -37,15 +48,37 @@ MAX_VALID_DATE = datetime.now()  # Not in future
 MIN_AMOUNT = 0.01  # At least 1 cent
 MAX_AMOUNT = 10000.00  # Max reasonable transaction
 
+# Text columns stored as Arrow-backed strings (contiguous UTF-8 buffers instead
+# of one Python object per cell) with NaN as the missing-value marker
+TEXT_COLUMNS = ['transaction_id', 'category', 'merchant', 'payment_method']
+
+try:
+    TEXT_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)  # pandas >= 2.3
+except TypeError:
+    try:
+        TEXT_DTYPE = pd.StringDtype("pyarrow_numpy")  # pandas 2.2
+    except ImportError:
+        TEXT_DTYPE = object  # PyArrow not installed
+except ImportError:
+    TEXT_DTYPE = object  # PyArrow not installed
+
 
 # ============================================================================
 # Helper Functions for Data Standardization
 # ============================================================================
 
+# Runs of whitespace collapsed to a single space in merchant names
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@singledispatch
 def standardize_category(category: str) -> str:
     """
     Standardize category names (title case, trim).
 
+    Dispatches on the argument type: strings take a direct fast path, while
+    nulls are returned unchanged and other values are stringified first.
+
     Args:
         category: Raw category string
 
@@ -60,13 +93,21 @@ def standardize_category(category: str) -> str:
     """
     if pd.isna(category):
         return category
-    return str(category).strip().title()
+    return _standardize_category_str(str(category))
 
 
+@standardize_category.register
+def _standardize_category_str(category: str) -> str:
+    return category.strip().title()
+
+
+@singledispatch
 def standardize_merchant(merchant: str) -> str:
     """
     Standardize merchant names (title case, trim, remove extra spaces).
 
+    Dispatches on the argument type like standardize_category.
+
     Args:
         merchant: Raw merchant string
 
@@ -79,18 +120,22 @@ def standardize_merchant(merchant: str) -> str:
     """
     if pd.isna(merchant):
         return merchant
+    return _standardize_merchant_str(str(merchant))
 
-    # Convert to string, strip, and remove extra spaces
-    merchant = str(merchant).strip()
-    merchant = ' '.join(merchant.split())  # Remove extra spaces
 
-    return merchant.title()
+@standardize_merchant.register
+def _standardize_merchant_str(merchant: str) -> str:
+    # Strip and collapse extra spaces
+    return _WHITESPACE_RE.sub(' ', merchant.strip()).title()
 
 
+@singledispatch
 def standardize_payment_method(payment_method: str) -> str:
     """
     Standardize payment method names (title case, trim).
 
+    Dispatches on the argument type like standardize_category.
+
     Args:
         payment_method: Raw payment method string
 
@@ -103,186 +148,300 @@ def standardize_payment_method(payment_method: str) -> str:
     """
     if pd.isna(payment_method):
         return payment_method
-    return str(payment_method).strip().title()
+    return _standardize_payment_method_str(str(payment_method))
 
 
-# ============================================================================
-# Data Cleaning Functions
-# ============================================================================
+@standardize_payment_method.register
+def _standardize_payment_method_str(payment_method: str) -> str:
+    return payment_method.strip().title()
 
-def clean_transaction_data(df: pd.DataFrame) -> pd.DataFrame:
+
+def _standardize_text_series(series: pd.Series, collapse_spaces: bool = False) -> pd.Series:
     """
-    Clean and standardize transaction data.
+    Vectorized counterpart of the scalar standardize_* helpers.
 
-    Performs the following operations:
-    - Removes duplicate transactions (by transaction_id)
-    - Trims whitespace from string columns
-    - Standardizes text casing
-    - Logs cleaning statistics
+    Applies strip and title case (optionally collapsing internal whitespace)
+    with pandas string kernels instead of a Python call per row. Non-string
+    values are stringified and nulls are preserved, matching the scalar helpers.
+    Columns are cast to TEXT_DTYPE (a no-op for string columns), so Arrow-backed
+    text stays Arrow-backed.
 
     Args:
-        df: Raw transaction DataFrame
+        series: Raw text column
+        collapse_spaces: Whether to collapse runs of whitespace to a single space
 
     Returns:
-        Cleaned DataFrame
+        Standardized text column
+    """
+    if isinstance(series.dtype, pd.StringDtype):
+        text = series
+    elif TEXT_DTYPE is object:
+        text = series.astype(str).where(series.notna())
+    else:
+        text = series.astype(TEXT_DTYPE)
+    text = text.str.strip()
+    if collapse_spaces:
+        text = text.str.replace(_WHITESPACE_RE, ' ', regex=True)
+    return text.str.title()
 
-    Example:
-        >>> df_clean = clean_transaction_data(df_raw)
-        >>> print(f"Removed {len(df_raw) - len(df_clean)} duplicates")
+
+def _standardize_category_series(categories: pd.Series) -> pd.Series:
+    """Series version of standardize_category."""
+    return _standardize_text_series(categories)
+
+
+def _standardize_merchant_series(merchants: pd.Series) -> pd.Series:
+    """Series version of standardize_merchant."""
+    return _standardize_text_series(merchants, collapse_spaces=True)
+
+
+def _standardize_payment_method_series(payment_methods: pd.Series) -> pd.Series:
+    """Series version of standardize_payment_method."""
+    return _standardize_text_series(payment_methods)
+
+
+def _parse_dates(dates: pd.Series) -> pd.Series:
     """
-    logger.info("Starting data cleaning...")
-    initial_count = len(df)
+    Parse text dates with the known CSV format, falling back only where needed.
 
-    # Make a copy to avoid modifying the original
-    df = df.copy()
+    The fixed DATE_FORMAT (with cache=True, so each distinct string is parsed
+    once) handles the expected ISO dates. Only the values it rejects are
+    re-parsed with format='mixed' and truncated to midnight, so a value that
+    carries a time of day lands on the same calendar date as the ISO rows;
+    anything still unparseable becomes NaT.
+
+    Args:
+        dates: Column of date strings
+
+    Returns:
+        datetime64 Series with NaT for unparseable values
+    """
+    parsed = pd.to_datetime(dates, format=DATE_FORMAT, cache=True, errors='coerce')
+
+    residue = (parsed.isna() & dates.notna()).to_numpy()
+    if residue.any():
+        try:
+            fallback = pd.to_datetime(dates[residue], format='mixed', cache=True, errors='coerce')
+        except ValueError:
+            fallback = None  # e.g. mixed timezones; the residue stays NaT
+
+        # Timezone-aware values cannot share the naive column; leave them as NaT
+        if fallback is not None and not isinstance(fallback.dtype, pd.DatetimeTZDtype):
+            parsed[residue] = fallback.dt.normalize()
+
+    return parsed
+
+
+def _to_allowed_categorical(series: pd.Series, dtype: pd.CategoricalDtype) -> pd.Series:
+    """
+    Encode a text column against a fixed categorical dtype.
+
+    Values outside the dtype's categories (and nulls) become NaN, i.e. code -1.
+    Columns that are already categorical are recoded through a per-category
+    lookup table indexed by their codes, with no per-row string hashing.
+
+    Args:
+        series: Standardized text column
+        dtype: Categorical dtype listing the allowed values
+
+    Returns:
+        Categorical Series with the same index and name
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Append -1 so null codes (-1) index the trailing "not allowed" entry
+        recode = np.append(dtype.categories.get_indexer(series.cat.categories), -1)
+        codes = recode[series.cat.codes.to_numpy()]
+    else:
+        codes = dtype.categories.get_indexer(series)
+    return pd.Series(
+        pd.Categorical.from_codes(codes, dtype=dtype),
+        index=series.index,
+        name=series.name
+    )
+
+
+# ============================================================================
+# Fused Clean / Validate Pass
+# ============================================================================
 
-    # Remove duplicate transaction_ids (keep first occurrence)
-    duplicates_before = df.duplicated(subset=['transaction_id']).sum()
-    if duplicates_before > 0:
-        logger.warning(f"Found {duplicates_before} duplicate transaction_ids")
-        df = df.drop_duplicates(subset=['transaction_id'], keep='first')
-        logger.info(f"Removed {duplicates_before} duplicate transactions (kept first occurrence)")
+def _standardize_columns(df: pd.DataFrame) -> np.ndarray:
+    """
+    Trim and standardize the text columns of df in place.
+
+    Duplicates are only flagged, not dropped, so the caller can fold them into
+    the single row filter applied at the end of _pipeline.
 
-    # Trim whitespace from string columns
-    string_columns = df.select_dtypes(include=['object']).columns
-    for col in string_columns:
-        df[col] = df[col].apply(lambda x: x.strip() if isinstance(x, str) else x)
+    Args:
+        df: Transaction DataFrame owned by the caller (modified in place)
+
+    Returns:
+        Boolean array marking repeated transaction_ids (all but the first occurrence)
+    """
+    # The hash pass that counts duplicates also provides the mask used to drop them
+    duplicate_mask = df['transaction_id'].duplicated(keep='first').to_numpy()
+    duplicates_count = duplicate_mask.sum()
+    if duplicates_count > 0:
+        logger.warning(f"Found {duplicates_count} duplicate transaction_ids")
+        logger.info(f"Removed {duplicates_count} duplicate transactions (kept first occurrence)")
+
+    # Trim whitespace from string columns with vectorized string kernels
+    for col in df.select_dtypes(include=['string']).columns:
+        df[col] = df[col].str.strip()
+
+    # Object columns: all-string columns strip directly; in mixed columns the
+    # string kernel yields NaN for non-string cells, which keep their value
+    object_columns = df.select_dtypes(include=['object'], exclude=['string']).columns
+    for col in object_columns:
+        values = df[col]
+        kind = pd.api.types.infer_dtype(values, skipna=True)
+        if kind == 'string':
+            values = values.str.strip()
+        elif kind in ('mixed', 'mixed-integer'):
+            stripped = values.str.strip()
+            values = stripped.where(stripped.notna(), values)
+        # Settle the dtype the same way an element-wise map would
+        df[col] = values.infer_objects()
 
     # Standardize text casing
     if 'category' in df.columns:
-        df['category'] = df['category'].apply(standardize_category)
+        df['category'] = _standardize_category_series(df['category'])
         logger.info("Standardized category names to title case")
 
     if 'merchant' in df.columns:
-        df['merchant'] = df['merchant'].apply(standardize_merchant)
+        df['merchant'] = _standardize_merchant_series(df['merchant'])
         logger.info("Standardized merchant names to title case")
 
     if 'payment_method' in df.columns:
-        df['payment_method'] = df['payment_method'].apply(standardize_payment_method)
+        df['payment_method'] = _standardize_payment_method_series(df['payment_method'])
         logger.info("Standardized payment method names to title case")
 
-    final_count = len(df)
-    logger.info(f"Data cleaning completed: {initial_count} → {final_count} rows")
-
-    return df
+    return duplicate_mask
 
 
-# ============================================================================
-# Data Validation Functions
-# ============================================================================
-
-def validate_transaction_data(df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
+def _validity_mask(
+    df: pd.DataFrame,
+    rows: np.ndarray,
+    issues: list[str],
+    fail_fast: bool = False
+) -> np.ndarray:
     """
-    Validate business rules and data quality.
+    Convert typed columns of df in place and compute the fused validity mask.
 
-    Validates:
-    - Amount > 0 and within reasonable range
-    - Valid dates (not future, not too old)
-    - Category in allowed list
-    - Payment method in allowed list
-    - No nulls in required fields
-    - User ID is valid integer
+    Every check contributes a NumPy mask that is AND-ed into one result. Issue
+    counts only cover the candidate rows, so rows already rejected (e.g. as
+    duplicates) are never reported twice.
+
+    Checks run cheapest first (nulls, numeric bounds, date bounds, then the
+    categorical encodings). With fail_fast, the remaining checks are skipped
+    as soon as no row can pass any more; issues from skipped checks are not
+    reported and their columns are left unconverted.
 
     Args:
-        df: Cleaned transaction DataFrame
+        df: Transaction DataFrame owned by the caller (modified in place)
+        rows: Boolean array of candidate rows still in play
+        issues: List that validation issue descriptions are appended to
+        fail_fast: Stop once every row has been rejected
 
     Returns:
-        Tuple of (valid_df, list_of_issues)
-        - valid_df: DataFrame with only valid records
-        - list_of_issues: List of validation issue descriptions
-
-    Example:
-        >>> valid_df, issues = validate_transaction_data(df_clean)
-        >>> for issue in issues:
-        >>>     print(f"Issue: {issue}")
+        Boolean array marking rows that are candidates and pass every check
     """
-    logger.info("Starting data validation...")
-    initial_count = len(df)
-    issues = []
-
-    # Make a copy to track validation
-    df = df.copy()
-    df['is_valid'] = True
+    is_valid = rows.copy()
 
     # Check for null values in required fields
     required_fields = ['transaction_id', 'date', 'category', 'amount', 'merchant', 'payment_method', 'user_id']
     for field in required_fields:
-        null_count = df[field].isnull().sum()
+        null_mask = df[field].isna().to_numpy() & rows
+        null_count = null_mask.sum()
         if null_count > 0:
             issue = f"Found {null_count} null values in '{field}' column"
             issues.append(issue)
             logger.warning(issue)
-            df.loc[df[field].isnull(), 'is_valid'] = False
+            is_valid &= ~null_mask
 
     # Validate amount
     try:
-        df['amount'] = pd.to_numeric(df['amount'], errors='coerce')
-
-        # Check for amounts <= 0
-        invalid_amounts = (df['amount'] <= 0) | (df['amount'].isnull())
-        invalid_count = invalid_amounts.sum()
-        if invalid_count > 0:
-            issue = f"Found {invalid_count} transactions with invalid amounts (≤ 0 or non-numeric)"
-            issues.append(issue)
-            logger.warning(issue)
-            df.loc[invalid_amounts, 'is_valid'] = False
-
-        # Check for amounts above maximum
-        too_large = df['amount'] > MAX_AMOUNT
-        too_large_count = too_large.sum()
-        if too_large_count > 0:
-            issue = f"Found {too_large_count} transactions with amounts > ${MAX_AMOUNT:,.2f}"
-            issues.append(issue)
-            logger.warning(issue)
-            df.loc[too_large, 'is_valid'] = False
+        amounts = pd.to_numeric(df['amount'], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+
+        # Amounts must lie in [MIN_AMOUNT, MAX_AMOUNT]: clipping leaves in-range values
+        # unchanged, and NaN never compares equal, so non-numeric is caught too
+        in_range = np.clip(amounts, MIN_AMOUNT, MAX_AMOUNT) == amounts
+        is_valid &= in_range
+
+        out_of_range = ~in_range & rows
+        if out_of_range.any():
+            too_large = out_of_range & (amounts > MAX_AMOUNT)
+
+            # Below minimum or non-numeric
+            invalid_count = (out_of_range & ~too_large).sum()
+            if invalid_count > 0:
+                issue = f"Found {invalid_count} transactions with invalid amounts (< ${MIN_AMOUNT:.2f} or non-numeric)"
+                issues.append(issue)
+                logger.warning(issue)
+
+            # Above maximum
+            too_large_count = too_large.sum()
+            if too_large_count > 0:
+                issue = f"Found {too_large_count} transactions with amounts > ${MAX_AMOUNT:,.2f}"
+                issues.append(issue)
+                logger.warning(issue)
 
         # Round amounts to 2 decimal places
-        df['amount'] = df['amount'].round(2)
+        df['amount'] = np.round(amounts, 2)
 
     except Exception as e:
         issue = f"Error validating amounts: {str(e)}"
         issues.append(issue)
         logger.error(issue)
 
+    if fail_fast and not is_valid.any():
+        return is_valid
+
     # Validate dates
     try:
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
+        # Extraction normally delivers parsed dates; only parse text dates here
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            df['date'] = _parse_dates(df['date'])
+        dates = df['date'].to_numpy()
 
         # Check for invalid date parsing
-        invalid_dates = df['date'].isnull()
+        invalid_dates = np.isnat(dates) & rows
         invalid_date_count = invalid_dates.sum()
         if invalid_date_count > 0:
             issue = f"Found {invalid_date_count} transactions with invalid date format"
             issues.append(issue)
             logger.warning(issue)
-            df.loc[invalid_dates, 'is_valid'] = False
+            is_valid &= ~invalid_dates
 
-        # Check for dates too old
-        valid_dates = ~invalid_dates
-        too_old = valid_dates & (df['date'] < MIN_VALID_DATE)
+        # Check for dates too old (NaT compares False, so unparsed dates are not double-counted)
+        too_old = (dates < np.datetime64(MIN_VALID_DATE)) & rows
         too_old_count = too_old.sum()
         if too_old_count > 0:
             issue = f"Found {too_old_count} transactions with dates before {MIN_VALID_DATE.strftime('%Y-%m-%d')}"
             issues.append(issue)
             logger.warning(issue)
-            df.loc[too_old, 'is_valid'] = False
+            is_valid &= ~too_old
 
         # Check for future dates
-        in_future = valid_dates & (df['date'] > MAX_VALID_DATE)
+        in_future = (dates > np.datetime64(MAX_VALID_DATE)) & rows
         future_count = in_future.sum()
         if future_count > 0:
             issue = f"Found {future_count} transactions with future dates"
             issues.append(issue)
             logger.warning(issue)
-            df.loc[in_future, 'is_valid'] = False
+            is_valid &= ~in_future
 
     except Exception as e:
         issue = f"Error validating dates: {str(e)}"
         issues.append(issue)
         logger.error(issue)
 
-    # Validate category
-    invalid_categories = ~df['category'].isin(ALLOWED_CATEGORIES)
+    if fail_fast and not is_valid.any():
+        return is_valid
+
+    # Validate category: casting to the allowed categorical dtype turns any
+    # value outside the allowed list into NaN (code -1)
+    categories = _to_allowed_categorical(df['category'], CATEGORY_DTYPE)
+    invalid_categories = categories.isna().to_numpy() & rows
     invalid_cat_count = invalid_categories.sum()
     if invalid_cat_count > 0:
         unique_invalid = df.loc[invalid_categories, 'category'].unique()
@@ -291,31 +450,35 @@ def validate_transaction_data(df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]
             issue += f" ... and {len(unique_invalid) - 5} more"
         issues.append(issue)
         logger.warning(issue)
-        df.loc[invalid_categories, 'is_valid'] = False
+        is_valid &= ~invalid_categories
+    df['category'] = categories
 
     # Validate payment method
-    invalid_payment = ~df['payment_method'].isin(ALLOWED_PAYMENT_METHODS)
+    payment_methods = _to_allowed_categorical(df['payment_method'], PAYMENT_METHOD_DTYPE)
+    invalid_payment = payment_methods.isna().to_numpy() & rows
     invalid_payment_count = invalid_payment.sum()
     if invalid_payment_count > 0:
         unique_invalid = df.loc[invalid_payment, 'payment_method'].unique()
         issue = f"Found {invalid_payment_count} transactions with invalid payment methods: {', '.join(map(str, unique_invalid))}"
         issues.append(issue)
         logger.warning(issue)
-        df.loc[invalid_payment, 'is_valid'] = False
+        is_valid &= ~invalid_payment
+    df['payment_method'] = payment_methods
 
     # Validate user_id is integer
     try:
         df['user_id'] = pd.to_numeric(df['user_id'], errors='coerce')
-        invalid_user_ids = df['user_id'].isnull()
+        non_numeric_user_ids = df['user_id'].isna().to_numpy()
+        invalid_user_ids = non_numeric_user_ids & rows
         invalid_user_count = invalid_user_ids.sum()
         if invalid_user_count > 0:
             issue = f"Found {invalid_user_count} transactions with invalid user_id (non-integer)"
             issues.append(issue)
             logger.warning(issue)
-            df.loc[invalid_user_ids, 'is_valid'] = False
+            is_valid &= ~invalid_user_ids
 
         # Convert to int (for valid ones) - use Int64 to handle potential nulls gracefully
-        if not invalid_user_ids.all():
+        if not non_numeric_user_ids[rows].all():
             df['user_id'] = df['user_id'].astype('Int64')
 
     except Exception as e:
@@ -323,17 +486,129 @@ def validate_transaction_data(df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]
         issues.append(issue)
         logger.error(issue)
 
-    # Filter to only valid records
-    valid_df = df[df['is_valid']].drop(columns=['is_valid']).copy()
-    invalid_count = initial_count - len(valid_df)
+    return is_valid
 
-    if invalid_count > 0:
-        logger.warning(f"Filtered out {invalid_count} invalid transactions")
-    else:
-        logger.info("All transactions passed validation")
 
-    logger.info(f"Data validation completed: {initial_count} → {len(valid_df)} valid rows")
+def _pipeline(
+    df: pd.DataFrame,
+    clean: bool = True,
+    validate: bool = True,
+    add_date_key: bool = False,
+    fail_fast: bool = False
+) -> tuple[pd.DataFrame, list[str], int]:
+    """
+    Run cleaning, validation and date_key derivation in one pass over one copy.
+
+    Each stage writes into a single copy of the input and contributes to one
+    boolean row mask; rows are filtered exactly once at the end instead of
+    once per stage.
 
+    Args:
+        df: Raw or cleaned transaction DataFrame (not modified)
+        clean: Drop duplicates and standardize text columns
+        validate: Apply business-rule validation and type conversion
+        add_date_key: Add a YYYYMMDD date_key column to the surviving rows
+        fail_fast: Skip the remaining validation checks once no row survives
+
+    Returns:
+        Tuple of (result_df, issues, duplicates_removed)
+    """
+    df = df.copy()
+    initial_count = len(df)
+    keep = np.ones(initial_count, dtype=bool)
+    issues = []
+    duplicates_removed = 0
+
+    if clean:
+        logger.info("Starting data cleaning...")
+        duplicate_mask = _standardize_columns(df)
+        duplicates_removed = int(duplicate_mask.sum())
+        keep &= ~duplicate_mask
+        logger.info(f"Data cleaning completed: {initial_count} → {initial_count - duplicates_removed} rows")
+
+    if validate:
+        logger.info("Starting data validation...")
+        candidate_count = initial_count - duplicates_removed
+        keep = _validity_mask(df, keep, issues, fail_fast=fail_fast)
+
+        invalid_count = candidate_count - keep.sum()
+        if invalid_count > 0:
+            logger.warning(f"Filtered out {invalid_count} invalid transactions")
+        else:
+            logger.info("All transactions passed validation")
+
+        logger.info(f"Data validation completed: {candidate_count} → {keep.sum()} valid rows")
+
+    # Filter to the surviving records in a single pass
+    result = df if keep.all() else df.loc[keep].copy()
+
+    if add_date_key:
+        # Transactions repeat a small set of dates: compute one key per distinct
+        # date and gather the keys back to the rows by factorize code
+        codes, unique_dates = pd.factorize(result['date'])
+        result['date_key'] = _date_key(pd.DatetimeIndex(unique_dates), dtype='int64').to_numpy()[codes]
+
+    return result, issues, duplicates_removed
+
+
+# ============================================================================
+# Data Cleaning Functions
+# ============================================================================
+
+def clean_transaction_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Clean and standardize transaction data.
+
+    Performs the following operations:
+    - Removes duplicate transactions (by transaction_id)
+    - Trims whitespace from string columns
+    - Standardizes text casing
+    - Logs cleaning statistics
+
+    Args:
+        df: Raw transaction DataFrame
+
+    Returns:
+        Cleaned DataFrame
+
+    Example:
+        >>> df_clean = clean_transaction_data(df_raw)
+        >>> print(f"Removed {len(df_raw) - len(df_clean)} duplicates")
+    """
+    df_clean, _, _ = _pipeline(df, validate=False)
+    return df_clean
+
+
+# ============================================================================
+# Data Validation Functions
+# ============================================================================
+
+def validate_transaction_data(df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
+    """
+    Validate business rules and data quality.
+
+    Validates:
+    - Amount between MIN_AMOUNT and MAX_AMOUNT
+    - Valid dates (not future, not too old)
+    - Category in allowed list
+    - Payment method in allowed list
+    - No nulls in required fields
+    - User ID is valid integer
+
+    Args:
+        df: Cleaned transaction DataFrame
+
+    Returns:
+        Tuple of (valid_df, list_of_issues)
+        - valid_df: DataFrame with only valid records
+        - list_of_issues: List of validation issue descriptions
+
+    Example:
+        >>> valid_df, issues = validate_transaction_data(df_clean)
+        >>> for issue in issues:
+        >>>     print(f"Issue: {issue}")
+    """
+    valid_df, issues, _ = _pipeline(df, clean=False)
     return valid_df, issues
 
 
@@ -341,6 +616,20 @@ def validate_transaction_data(df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]
 # Date Dimension Functions
 # ============================================================================
 
+def _date_key(dates, dtype: str = 'int32'):
+    """
+    Compute YYYYMMDD integer date keys with integer arithmetic.
+
+    Args:
+        dates: DatetimeIndex or Series.dt accessor over values without NaT
+        dtype: Integer dtype of the returned keys
+
+    Returns:
+        Date keys aligned with dates (Index or Series, matching the input)
+    """
+    return (dates.year * 10000 + dates.month * 100 + dates.day).astype(dtype)
+
+
 def derive_date_attributes(date_series: pd.Series) -> pd.DataFrame:
     """
     Calculate all date dimension attributes.
@@ -372,30 +661,32 @@ def derive_date_attributes(date_series: pd.Series) -> pd.DataFrame:
     """
     logger.info("Deriving date dimension attributes...")
 
-    # Create DataFrame from unique dates
-    unique_dates = pd.DataFrame({'date': date_series.unique()})
-    unique_dates = unique_dates.sort_values('date').reset_index(drop=True)
-
-    # Generate date_key as YYYYMMDD integer
-    unique_dates['date_key'] = unique_dates['date'].dt.strftime('%Y%m%d').astype(int)
-
-    # Extract date components
-    unique_dates['year'] = unique_dates['date'].dt.year
-    unique_dates['quarter'] = unique_dates['date'].dt.quarter
-    unique_dates['month'] = unique_dates['date'].dt.month
-    unique_dates['day'] = unique_dates['date'].dt.day
-
-    # Get date names
-    unique_dates['month_name'] = unique_dates['date'].dt.month_name()
-    unique_dates['day_name'] = unique_dates['date'].dt.day_name()
-
-    # Get calendar positions
-    # ISO weekday: Monday=1, Sunday=7
-    unique_dates['day_of_week'] = unique_dates['date'].dt.isocalendar().day
-    unique_dates['week_of_year'] = unique_dates['date'].dt.isocalendar().week
-
-    # Calculate is_weekend (Saturday=6, Sunday=7 in ISO format)
-    unique_dates['is_weekend'] = unique_dates['day_of_week'].isin([6, 7])
+    # Unique dates in ascending order; DatetimeIndex accessors return plain
+    # arrays without building an intermediate Series per attribute
+    dates = pd.DatetimeIndex(date_series.dropna().unique()).sort_values()
+
+    # Monday=0 ... Sunday=6
+    day_of_week = dates.dayofweek
+
+    # All attributes come from C-level datetime accessors in narrow integer dtypes;
+    # date_key (YYYYMMDD) uses integer arithmetic rather than string formatting.
+    # Everything is assembled in one constructor call that adopts the freshly
+    # computed arrays (copy=False) rather than copying each into the frame.
+    unique_dates = pd.DataFrame({
+        'date': dates,
+        'date_key': _date_key(dates),
+        'year': dates.year.astype('int16'),
+        'quarter': dates.quarter.astype('int8'),
+        'month': dates.month.astype('int8'),
+        'day': dates.day.astype('int8'),
+        'month_name': dates.month_name(),
+        'day_name': dates.day_name(),
+        # ISO numbering: Monday=1 ... Sunday=7
+        'day_of_week': (day_of_week + 1).astype('int8'),
+        'week_of_year': dates.isocalendar()['week'].to_numpy(dtype='int8'),
+        # Saturday and Sunday
+        'is_weekend': day_of_week >= 5
+    }, copy=False)
 
     logger.info(f"Derived attributes for {len(unique_dates)} unique dates")
     logger.info(f"Date range: {unique_dates['date'].min().strftime('%Y-%m-%d')} to {unique_dates['date'].max().strftime('%Y-%m-%d')}")
@@ -407,6 +698,31 @@ def derive_date_attributes(date_series: pd.Series) -> pd.DataFrame:
 # Dimension Creation Functions
 # ============================================================================
 
+def _sorted_unique_values(series: pd.Series) -> np.ndarray | pd.Index | pd.api.extensions.ExtensionArray:
+    """
+    Sorted distinct values of a dimension column without a Python-level sort.
+
+    Categorical columns read the categories in use straight from their codes
+    (no hashing); numeric and text columns hash out their distinct values and
+    sort only those, which beats sorting every row when keys repeat.
+
+    Args:
+        series: Validated column holding a dimension's natural key
+
+    Returns:
+        Array-like of unique values in ascending order
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        in_use = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories)) > 0
+        return series.cat.categories[in_use].sort_values()
+
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return np.sort(np.asarray(series.unique()))
+
+    return series.drop_duplicates().sort_values().array
+
+
 def create_dimension_data(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
     """
     Extract unique dimension values from fact data.
@@ -438,30 +754,26 @@ def create_dimension_data(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
     logger.info(f"Created dim_date with {len(dimensions['dim_date'])} unique dates")
 
     # Category dimension
-    unique_categories = df['category'].unique()
     dimensions['dim_category'] = pd.DataFrame({
-        'category_name': sorted(unique_categories)
+        'category_name': _sorted_unique_values(df['category'])
     })
     logger.info(f"Created dim_category with {len(dimensions['dim_category'])} categories")
 
     # Merchant dimension
-    unique_merchants = df['merchant'].unique()
     dimensions['dim_merchant'] = pd.DataFrame({
-        'merchant_name': sorted(unique_merchants)
+        'merchant_name': _sorted_unique_values(df['merchant'])
     })
     logger.info(f"Created dim_merchant with {len(dimensions['dim_merchant'])} merchants")
 
     # Payment method dimension
-    unique_payment_methods = df['payment_method'].unique()
     dimensions['dim_payment_method'] = pd.DataFrame({
-        'payment_method_name': sorted(unique_payment_methods)
+        'payment_method_name': _sorted_unique_values(df['payment_method'])
     })
     logger.info(f"Created dim_payment_method with {len(dimensions['dim_payment_method'])} payment methods")
 
     # User dimension
-    unique_users = df['user_id'].unique()
     dimensions['dim_user'] = pd.DataFrame({
-        'user_id': sorted(unique_users)
+        'user_id': _sorted_unique_values(df['user_id'])
     })
     logger.info(f"Created dim_user with {len(dimensions['dim_user'])} users")
 
@@ -492,27 +804,30 @@ def log_transformation_summary(
     Example:
         >>> log_transformation_summary(10000, 9950, 30, 20, ["Issue 1", "Issue 2"])
     """
-    logger.info("=" * 80)
-    logger.info("TRANSFORMATION SUMMARY")
-    logger.info("=" * 80)
-
-    logger.info(f"Original record count: {original_count:,}")
-    logger.info(f"Duplicates removed: {duplicates_removed:,}")
-    logger.info(f"Invalid records filtered: {invalid_removed:,}")
-    logger.info(f"Final valid record count: {final_count:,}")
-
-    if original_count > 0:
-        success_rate = (final_count / original_count) * 100
-        logger.info(f"Success rate: {success_rate:.2f}%")
+    # Each block is formatted once and emitted as a single multi-line record,
+    # so the handler chain runs per block rather than per line or per issue
+    if logger.isEnabledFor(logging.INFO):
+        summary_lines = [
+            "=" * 80,
+            "TRANSFORMATION SUMMARY",
+            "=" * 80,
+            f"Original record count: {original_count:,}",
+            f"Duplicates removed: {duplicates_removed:,}",
+            f"Invalid records filtered: {invalid_removed:,}",
+            f"Final valid record count: {final_count:,}",
+        ]
+        if original_count > 0:
+            success_rate = (final_count / original_count) * 100
+            summary_lines.append(f"Success rate: {success_rate:.2f}%")
+        logger.info("\n".join(summary_lines))
 
     if issues:
-        logger.warning(f"Total data quality issues found: {len(issues)}")
-        for idx, issue in enumerate(issues, 1):
-            logger.warning(f"  {idx}. {issue}")
+        issue_lines = [f"Total data quality issues found: {len(issues)}"]
+        issue_lines.extend(f"  {idx}. {issue}" for idx, issue in enumerate(issues, 1))
+        logger.warning("\n".join(issue_lines))
+        logger.info("=" * 80)
     else:
-        logger.info("No data quality issues found")
-
-    logger.info("=" * 80)
+        logger.info("No data quality issues found\n" + "=" * 80)
 
 
 # ============================================================================
@@ -545,7 +860,7 @@ def transform_transactions(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
 
     Raises:
         ValueError: If the input DataFrame is empty or invalid
-        Exception: For unexpected errors during transformation
+        Exception: Unexpected errors are logged and re-raised unchanged
 
     Example:
         >>> from src.extract import extract_transactions
@@ -571,26 +886,35 @@ def transform_transactions(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
         original_count = len(df)
         logger.info(f"Input record count: {original_count:,}")
 
-        # Step 1: Clean data
-        df_clean = clean_transaction_data(df)
-        duplicates_removed = original_count - len(df_clean)
+        # Store text columns as Arrow-backed strings for the rest of the pipeline
+        df = df.astype({col: TEXT_DTYPE for col in TEXT_COLUMNS if col in df.columns})
 
-        # Step 2: Validate data
-        df_valid, issues = validate_transaction_data(df_clean)
-        invalid_removed = len(df_clean) - len(df_valid)
+        # Steps 1-2: Clean and validate data in one fused pass, deriving the
+        # fact date_key for the surviving rows on the way out. An all-invalid
+        # batch is rejected below, so validation may stop as soon as it is empty.
+        df_valid, issues, duplicates_removed = _pipeline(df, add_date_key=True, fail_fast=True)
+        invalid_removed = original_count - duplicates_removed - len(df_valid)
 
         if df_valid.empty:
             error_msg = "No valid records remaining after transformation"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
+        # Factorize merchant names once: the sorted uniques become the merchant
+        # dimension and the codes let the load phase resolve surrogate keys per
+        # distinct name instead of hashing every row again
+        codes, uniques = pd.factorize(df_valid['merchant'], sort=True)
+        df_valid['merchant'] = pd.Categorical.from_codes(codes, categories=uniques)
+
         # Step 3: Create dimensions
         dimensions = create_dimension_data(df_valid)
 
         # Step 4: Prepare fact data
         logger.info("Preparing fact table data...")
 
-        # Create fact DataFrame with necessary columns
+        # Create fact DataFrame with necessary columns. Copy explicitly: on
+        # pandas 2.x (no Copy-on-Write by default) the selection is flagged as
+        # a possible view of df_valid, so later writes would warn
         fact_data = df_valid[[
             'transaction_id',
             'date',
@@ -598,12 +922,10 @@ def transform_transactions(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
             'merchant',
             'payment_method',
             'user_id',
-            'amount'
+            'amount',
+            'date_key'
         ]].copy()
 
-        # Add date_key for dimension matching
-        fact_data['date_key'] = fact_data['date'].dt.strftime('%Y%m%d').astype(int)
-
         logger.info(f"Prepared fact table with {len(fact_data)} records")
 
         # Step 5: Log transformation summary
@@ -635,12 +957,10 @@ def transform_transactions(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
         # Re-raise ValueError as-is
         raise
 
-    except Exception as e:
-        # Catch any unexpected errors
-        error_msg = f"Unexpected error during transformation: {str(e)}"
-        logger.error(error_msg)
-        logger.error(f"Error type: {type(e).__name__}")
-        raise Exception(error_msg) from e
+    except Exception:
+        # Log unexpected errors with traceback and re-raise the original exception
+        logger.exception("Unexpected error during transformation")
+        raise
 
 
 if __name__ == "__main__":
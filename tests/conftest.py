@@ -6,11 +6,68 @@ including test data, file creation, and configuration.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv
+import psycopg2.extensions
 import logging
 from datetime import datetime, timedelta
+from typing import NamedTuple
+from unittest.mock import Mock
 
-from src.config import REQUIRED_CSV_COLUMNS
+from src.config import REQUIRED_CSV_COLUMNS, TRANSACTIONS_CSV
+from src.extract import extract_transactions, get_file_info
+
+# Data fixtures with scope="session" are built once and shared by every test
+# that requests them; a test that needs to modify one must work on a copy.
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _write_csv(df: pd.DataFrame, path) -> None:
+    """
+    Write a DataFrame to CSV using PyArrow's vectorized writer.
+
+    Args:
+        df: DataFrame to write (index is not written)
+        path: Destination file path
+    """
+    pyarrow.csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+
+
+class Dimensions(NamedTuple):
+    """Sample dimension DataFrames, one field per dimension table."""
+
+    category: pd.DataFrame
+    merchant: pd.DataFrame
+    payment_method: pd.DataFrame
+    user: pd.DataFrame
+    date: pd.DataFrame
+
+
+def _seq(*results):
+    """
+    Build a plain callable returning each result in turn.
+
+    Cheaper than assigning a list to Mock.side_effect for stubbing
+    sequential cursor reads such as the COUNT(*) before/after an insert.
+
+    Args:
+        *results: Values to return on successive calls
+
+    Returns:
+        Callable: Function ignoring its arguments and yielding the next result
+
+    Example:
+        >>> fetchone = _seq((0,), (3,))
+        >>> fetchone(), fetchone()
+        ((0,), (3,))
+    """
+    it = iter(results)
+    return lambda *args, **kwargs: next(it)
 
 
 # ============================================================================
@@ -32,22 +89,24 @@ def required_columns():
 # Data Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_transaction_data():
     """
     Provides a valid transaction DataFrame for testing.
 
+    Low-cardinality text columns are dictionary-encoded as Categorical.
+
     Returns:
         pd.DataFrame: DataFrame with all required columns and valid data
     """
     return pd.DataFrame({
         "transaction_id": ["TXN001", "TXN002", "TXN003"],
         "date": ["2023-01-01", "2023-01-02", "2023-01-03"],
-        "category": ["Food", "Transport", "Entertainment"],
-        "amount": [10.50, 20.75, 30.00],
-        "merchant": ["Store A", "Store B", "Store C"],
-        "payment_method": ["Credit Card", "Debit Card", "Cash"],
-        "user_id": [1, 2, 3]
+        "category": pd.Categorical(["Food", "Transport", "Entertainment"]),
+        "amount": np.array([10.50, 20.75, 30.00]),
+        "merchant": pd.Categorical(["Store A", "Store B", "Store C"]),
+        "payment_method": pd.Categorical(["Credit Card", "Debit Card", "Cash"]),
+        "user_id": np.array([1, 2, 3], dtype=np.int64)
     })
 
 
@@ -80,56 +139,83 @@ def incomplete_dataframe():
 # File Fixtures
 # ============================================================================
 
-@pytest.fixture
-def valid_csv_file(tmp_path, valid_transaction_data):
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
     """
-    Creates a temporary valid CSV file for testing.
+    Provides a session-wide temporary directory for read-only file fixtures.
 
     Args:
-        tmp_path: pytest's temporary path fixture
+        tmp_path_factory: pytest's session-scoped temporary path factory
+
+    Returns:
+        Path: Directory shared by all tests in the session
+    """
+    return tmp_path_factory.mktemp("etl_shared")
+
+
+@pytest.fixture(scope="session")
+def write_csv():
+    """
+    Provides the PyArrow-backed CSV writer used by the file fixtures.
+
+    Returns:
+        Callable[[pd.DataFrame, Path], None]: Function writing a DataFrame to a CSV path
+    """
+    return _write_csv
+
+
+@pytest.fixture(scope="session")
+def valid_csv_file(shared_tmp, valid_transaction_data):
+    """
+    Creates a valid CSV file once per session for testing.
+
+    Args:
+        shared_tmp: Session-wide temporary directory
         valid_transaction_data: Fixture providing valid DataFrame
 
     Returns:
-        str: Path to the created CSV file
+        str: Path to the created CSV file (read-only; do not modify)
     """
-    file_path = tmp_path / "valid_transactions.csv"
-    valid_transaction_data.to_csv(file_path, index=False)
+    file_path = shared_tmp / "valid_transactions.csv"
+    if not file_path.exists():
+        _write_csv(valid_transaction_data, file_path)
     return str(file_path)
 
 
-@pytest.fixture
-def empty_csv_file(tmp_path):
+@pytest.fixture(scope="session")
+def empty_csv_file(shared_tmp):
     """
-    Creates a temporary empty CSV file for testing.
+    Creates an empty CSV file once per session for testing.
 
     Args:
-        tmp_path: pytest's temporary path fixture
+        shared_tmp: Session-wide temporary directory
 
     Returns:
-        str: Path to the created empty CSV file
+        str: Path to the created empty CSV file (read-only; do not modify)
     """
-    file_path = tmp_path / "empty.csv"
+    file_path = shared_tmp / "empty.csv"
     file_path.touch()
     return str(file_path)
 
 
-@pytest.fixture
-def incomplete_csv_file(tmp_path):
+@pytest.fixture(scope="session")
+def incomplete_csv_file(shared_tmp):
     """
-    Creates a temporary CSV file with missing required columns.
+    Creates a CSV file with missing required columns once per session.
 
     Args:
-        tmp_path: pytest's temporary path fixture
+        shared_tmp: Session-wide temporary directory
 
     Returns:
-        str: Path to the created incomplete CSV file
-    """
-    file_path = tmp_path / "incomplete.csv"
-    file_path.write_text(
-        "transaction_id,amount\n"
-        "TXN001,100.0\n"
-        "TXN002,200.0\n"
-    )
+        str: Path to the created incomplete CSV file (read-only; do not modify)
+    """
+    file_path = shared_tmp / "incomplete.csv"
+    if not file_path.exists():
+        file_path.write_text(
+            "transaction_id,amount\n"
+            "TXN001,100.0\n"
+            "TXN002,200.0\n"
+        )
     return str(file_path)
 
 
@@ -147,6 +233,32 @@ def nonexistent_file_path(tmp_path):
     return str(tmp_path / "nonexistent.csv")
 
 
+@pytest.fixture(scope="session")
+def real_transactions_df():
+    """
+    Extracts the real transactions.csv once and shares it across tests.
+
+    Returns:
+        pd.DataFrame | None: Extracted data, or None if the file is not available
+    """
+    if not TRANSACTIONS_CSV.exists():
+        return None
+    return extract_transactions(str(TRANSACTIONS_CSV))
+
+
+@pytest.fixture(scope="session")
+def real_transactions_info():
+    """
+    Collects file metadata for the real transactions.csv once per session.
+
+    Returns:
+        dict | None: File metadata from get_file_info, or None if the file is not available
+    """
+    if not TRANSACTIONS_CSV.exists():
+        return None
+    return get_file_info(str(TRANSACTIONS_CSV))
+
+
 # ============================================================================
 # Logging Fixtures
 # ============================================================================
@@ -171,13 +283,13 @@ def disable_logging():
 # Transform Module Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def clean_transform_data():
     """
     Provides clean transaction data for transform testing.
 
     Returns:
-        pd.DataFrame: Clean transaction data with valid values
+        pd.DataFrame: Four valid transactions (TXN001-TXN004) across three users
     """
     return pd.DataFrame({
         "transaction_id": ["TXN001", "TXN002", "TXN003", "TXN004"],
@@ -190,13 +302,13 @@ def clean_transform_data():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dirty_transform_data():
     """
     Provides dirty transaction data with various issues for transform testing.
 
     Returns:
-        pd.DataFrame: Transaction data with whitespace, mixed case, and duplicates
+        pd.DataFrame: Four rows with padded/mixed-case text and TXN001 repeated
     """
     return pd.DataFrame({
         "transaction_id": ["TXN001", "TXN002", "TXN001", "TXN003"],  # Duplicate
@@ -209,13 +321,14 @@ def dirty_transform_data():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_transform_data():
     """
     Provides transaction data with validation issues.
 
     Returns:
-        pd.DataFrame: Transaction data with invalid amounts, dates, categories, etc.
+        pd.DataFrame: Six rows, only TXN001 and TXN006 valid; the rest have a bad
+            amount, date, category, payment method or user_id
     """
     future_date = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
     old_date = "2019-01-01"  # Before MIN_VALID_DATE (2020-01-01)
@@ -231,63 +344,91 @@ def invalid_transform_data():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_date_series():
     """
     Provides a sample date series for date dimension testing.
 
     Returns:
-        pd.Series: Series of datetime objects
+        pd.Series: Daily datetimes from 2023-06-15 to 2023-06-20
     """
     dates = pd.date_range(start="2023-06-15", end="2023-06-20", freq="D")
     return pd.Series(dates)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def weekend_date_series():
     """
     Provides dates that include weekends for testing weekend detection.
 
     Returns:
-        pd.Series: Series including Saturday and Sunday
+        pd.Series: Friday 2023-06-16 through Monday 2023-06-19
     """
     # June 17, 2023 is Saturday, June 18 is Sunday
     dates = pd.to_datetime(["2023-06-16", "2023-06-17", "2023-06-18", "2023-06-19"])
     return pd.Series(dates)
 
 
-@pytest.fixture
-def transform_constants():
+@pytest.fixture(scope="session")
+def allowed_categories():
+    """
+    Provides the allowed category names once per session.
+
+    Returns:
+        frozenset[str]: The transform module's ALLOWED_CATEGORIES
+    """
+    from src.transform import ALLOWED_CATEGORIES
+
+    return ALLOWED_CATEGORIES
+
+
+@pytest.fixture(scope="session")
+def allowed_payment_methods():
+    """
+    Provides the allowed payment method names once per session.
+
+    Returns:
+        frozenset[str]: The transform module's ALLOWED_PAYMENT_METHODS
+    """
+    from src.transform import ALLOWED_PAYMENT_METHODS
+
+    return ALLOWED_PAYMENT_METHODS
+
+
+@pytest.fixture(scope="session")
+def transform_constants(allowed_categories, allowed_payment_methods):
     """
     Provides transform module constants for testing.
 
+    Args:
+        allowed_categories: Session-wide allowed category names
+        allowed_payment_methods: Session-wide allowed payment method names
+
     Returns:
         dict: Dictionary with transform constants
     """
     from src.transform import (
-        ALLOWED_CATEGORIES,
-        ALLOWED_PAYMENT_METHODS,
         MIN_VALID_DATE,
         MIN_AMOUNT,
         MAX_AMOUNT
     )
 
     return {
-        "allowed_categories": ALLOWED_CATEGORIES,
-        "allowed_payment_methods": ALLOWED_PAYMENT_METHODS,
+        "allowed_categories": allowed_categories,
+        "allowed_payment_methods": allowed_payment_methods,
         "min_valid_date": MIN_VALID_DATE,
         "min_amount": MIN_AMOUNT,
         "max_amount": MAX_AMOUNT
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validated_transform_data():
     """
     Provides validated transaction data with datetime conversion for dimension testing.
 
     Returns:
-        pd.DataFrame: Transaction data with datetime dates, ready for dimension creation
+        pd.DataFrame: clean_transform_data with datetime64 dates, ready for dimension creation
     """
     return pd.DataFrame({
         "transaction_id": ["TXN001", "TXN002", "TXN003", "TXN004"],
@@ -304,68 +445,102 @@ def validated_transform_data():
 # Load Module Fixtures
 # ============================================================================
 
+@pytest.fixture(scope="module")
+def _cursor_template():
+    """
+    Provides a module-scoped mock cursor reused (and reset) by mock_cursor.
+
+    Returns:
+        Mock: Mock cursor specced against psycopg2.extensions.cursor
+    """
+    return Mock(spec=psycopg2.extensions.cursor)
+
+
+@pytest.fixture(scope="module")
+def _connection_template():
+    """
+    Provides a module-scoped mock connection reused (and reset) by mock_db_connection.
+
+    Returns:
+        Mock: Mock connection specced against psycopg2.extensions.connection
+    """
+    return Mock(spec=psycopg2.extensions.connection)
+
+
+@pytest.fixture(scope="session")
+def seq():
+    """
+    Provides the sequential-result stub builder for mock cursor reads.
+
+    Returns:
+        Callable[..., Callable]: Function building a callable that returns each argument in turn
+    """
+    return _seq
+
+
 @pytest.fixture
-def mock_cursor():
+def mock_cursor(_cursor_template):
     """
     Provides a mock database cursor for load testing.
 
+    Args:
+        _cursor_template: Cached mock cursor, reset before each test
+
     Returns:
-        Mock: Mock cursor object with execute, fetchall, fetchone, and execute_batch methods
+        Mock: Mock cursor object with execute, copy_expert, fetchall, and fetchone methods
     """
-    from unittest.mock import Mock
-    cursor = Mock()
-    cursor.execute = Mock()
-    cursor.fetchall = Mock(return_value=[])
+    cursor = _cursor_template
+    cursor.reset_mock(return_value=True, side_effect=True)
+    cursor.fetchall.return_value = []
+    # Tests may replace fetchmany/fetchone with seq() callables, so restore mocks each time
+    cursor.fetchmany = Mock(return_value=[])
     cursor.fetchone = Mock(return_value=(0,))  # Default return value for COUNT queries
     cursor.rowcount = 0
-    cursor.close = Mock()
     return cursor
 
 
 @pytest.fixture
-def mock_db_connection(mock_cursor):
+def mock_db_connection(_connection_template, mock_cursor):
     """
     Provides a mock database connection for load testing.
 
     Args:
+        _connection_template: Cached mock connection, reset before each test
         mock_cursor: Mock cursor fixture
 
     Returns:
         Mock: Mock connection object with cursor, commit, rollback, and close methods
     """
-    from unittest.mock import Mock
-    conn = Mock()
-    conn.cursor = Mock(return_value=mock_cursor)
-    conn.commit = Mock()
-    conn.rollback = Mock()
-    conn.close = Mock()
+    conn = _connection_template
+    conn.reset_mock(return_value=True, side_effect=True)
+    conn.cursor.return_value = mock_cursor
     conn.autocommit = False
     conn.closed = False  # Connection starts as open
     return conn
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dimension_dataframes():
     """
     Provides sample dimension DataFrames for load testing.
 
     Returns:
-        dict: Dictionary with dimension DataFrames (category, merchant, payment_method, user, date)
+        Dimensions: NamedTuple of dimension DataFrames (category, merchant, payment_method, user, date)
     """
-    return {
-        "category": pd.DataFrame({
+    return Dimensions(
+        category=pd.DataFrame({
             "category_name": ["Groceries", "Dining", "Transportation"]
         }),
-        "merchant": pd.DataFrame({
+        merchant=pd.DataFrame({
             "merchant_name": ["Whole Foods", "Starbucks", "Uber"]
         }),
-        "payment_method": pd.DataFrame({
+        payment_method=pd.DataFrame({
             "payment_method_name": ["Credit Card", "Debit Card", "Digital Wallet"]
         }),
-        "user": pd.DataFrame({
+        user=pd.DataFrame({
             "user_id": [1, 2, 3]
         }),
-        "date": pd.DataFrame({
+        date=pd.DataFrame({
             "date_key": [20230615, 20230616, 20230617],
             "date": pd.to_datetime(["2023-06-15", "2023-06-16", "2023-06-17"]),
             "year": [2023, 2023, 2023],
@@ -378,16 +553,16 @@ def dimension_dataframes():
             "week_of_year": [24, 24, 24],
             "is_weekend": [False, False, True]
         })
-    }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dimension_mappings():
     """
     Provides sample dimension key mappings for load testing.
 
     Returns:
-        dict: Dictionary with dimension mappings (natural key -> surrogate key)
+        dict: Natural key -> surrogate key dict per dimension, three entries each
     """
     return {
         "category": {"Groceries": 1, "Dining": 2, "Transportation": 3},
@@ -398,13 +573,34 @@ def dimension_mappings():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def dimension_mappings_arrays(dimension_mappings):
+    """
+    Provides the dimension key mappings as sorted NumPy lookup arrays.
+
+    Args:
+        dimension_mappings: Dict-based dimension mappings fixture
+
+    Returns:
+        dict: Dictionary with (sorted natural keys, surrogate keys) array tuples per dimension
+    """
+    arrays = {}
+    for dim_name, mapping in dimension_mappings.items():
+        natural_keys = sorted(mapping)
+        arrays[dim_name] = (
+            np.array(natural_keys),
+            np.array([mapping[key] for key in natural_keys], dtype=np.int64)
+        )
+    return arrays
+
+
+@pytest.fixture(scope="session")
 def enriched_fact_data():
     """
     Provides enriched fact DataFrame with surrogate keys for load testing.
 
     Returns:
-        pd.DataFrame: Fact data with surrogate keys added
+        pd.DataFrame: TXN001-TXN003 with FACT_COLUMNS surrogate keys 1-3
     """
     return pd.DataFrame({
         "transaction_id": ["TXN001", "TXN002", "TXN003"],
@@ -417,12 +613,28 @@ def enriched_fact_data():
     })
 
 
-@pytest.fixture
+@pytest.fixture(params=[3, 2, 1], ids=["one_batch", "two_batches", "three_batches"])
+def enriched_fact_batches(request, enriched_fact_data):
+    """
+    Provides enriched_fact_data as Arrow record batches of varying size.
+
+    Args:
+        request: pytest request carrying the maximum rows per batch
+        enriched_fact_data: Fixture providing enriched fact DataFrame
+
+    Returns:
+        list[pa.RecordBatch]: Fact rows split into record batches
+    """
+    table = pa.Table.from_pandas(enriched_fact_data, preserve_index=False)
+    return table.to_batches(max_chunksize=request.param)
+
+
+@pytest.fixture(scope="session")
 def existing_transaction_ids():
     """
     Provides a set of existing transaction IDs for incremental load testing.
 
     Returns:
-        set: Set of transaction IDs that already exist in the database
+        frozenset: Transaction IDs that already exist in the database
     """
-    return {"TXN001", "TXN002"}
+    return frozenset({"TXN001", "TXN002"})
@@ -10,11 +10,12 @@ This test suite validates the extraction module's functionality including:
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
-from src.extract import extract_transactions, validate_csv_structure, get_file_info
-from src.config import REQUIRED_CSV_COLUMNS, TRANSACTIONS_CSV
+from src.extract import extract_transactions, validate_csv_structure, get_file_info, MissingColumnsError
+from src.config import REQUIRED_CSV_COLUMNS
 
 
 # ============================================================================
@@ -53,12 +54,12 @@ class TestGetFileInfo:
 
     @pytest.mark.integration
     @pytest.mark.file_operations
-    def test_real_transactions_file(self):
+    def test_real_transactions_file(self, real_transactions_info):
         """Test getting info for the actual transactions.csv file."""
-        if not TRANSACTIONS_CSV.exists():
+        if real_transactions_info is None:
             pytest.skip("Real transaction data not available")
 
-        info = get_file_info(str(TRANSACTIONS_CSV))
+        info = real_transactions_info
 
         assert info["exists"] is True
         assert info["file_size"] > 0
@@ -134,12 +135,12 @@ class TestExtractTransactions:
 
     @pytest.mark.integration
     @pytest.mark.file_operations
-    def test_extraction_with_real_data(self, required_columns):
+    def test_extraction_with_real_data(self, real_transactions_df, required_columns):
         """Test extraction with the actual transactions.csv file."""
-        if not TRANSACTIONS_CSV.exists():
+        if real_transactions_df is None:
             pytest.skip("Real transaction data not available")
 
-        df = extract_transactions(str(TRANSACTIONS_CSV))
+        df = real_transactions_df
 
         assert len(df) > 0
         for col in required_columns:
@@ -150,7 +151,7 @@ class TestExtractTransactions:
     @pytest.mark.parametrize("csv_fixture,expected_exception,error_message_contains", [
         ("nonexistent_file_path", FileNotFoundError, "File not found"),
         ("empty_csv_file", pd.errors.EmptyDataError, ""),
-        ("incomplete_csv_file", ValueError, "Missing required columns"),
+        ("incomplete_csv_file", MissingColumnsError, ""),
     ], ids=["file_not_found", "empty_csv", "missing_columns"])
     def test_error_handling(self, csv_fixture, expected_exception, error_message_contains, request):
         """Test error handling for various invalid input scenarios."""
@@ -162,6 +163,39 @@ class TestExtractTransactions:
         if error_message_contains:
             assert error_message_contains in str(exc_info.value)
 
+    @pytest.mark.unit
+    @pytest.mark.error_handling
+    def test_missing_columns_error_lists_columns(self, incomplete_csv_file):
+        """Test MissingColumnsError exposes exactly the absent columns."""
+        with pytest.raises(MissingColumnsError) as exc_info:
+            extract_transactions(incomplete_csv_file)
+
+        assert isinstance(exc_info.value, ValueError)
+        assert exc_info.value.missing == {"date", "category", "merchant", "payment_method", "user_id"}
+
+    @pytest.mark.integration
+    @pytest.mark.file_operations
+    def test_parses_iso_dates(self, valid_csv_file):
+        """Test ISO date strings are parsed to datetime during extraction."""
+        df = extract_transactions(valid_csv_file)
+
+        assert pd.api.types.is_datetime64_any_dtype(df["date"])
+        assert df["date"].iloc[0] == pd.Timestamp("2023-01-01")
+
+    @pytest.mark.integration
+    @pytest.mark.file_operations
+    def test_keeps_text_dates_when_unparseable(self, tmp_path, valid_transaction_data, write_csv):
+        """Test a non-ISO date leaves the column as text for transform validation."""
+        df_bad = valid_transaction_data.copy()
+        df_bad["date"] = ["2023-01-01", "not-a-date", "2023-01-03"]
+        csv_file = tmp_path / "bad_dates.csv"
+        write_csv(df_bad, csv_file)
+
+        df = extract_transactions(str(csv_file))
+
+        assert not pd.api.types.is_datetime64_any_dtype(df["date"])
+        assert df["date"].tolist() == ["2023-01-01", "not-a-date", "2023-01-03"]
+
     @pytest.mark.integration
     @pytest.mark.file_operations
     def test_data_integrity(self, tmp_path, valid_transaction_data):
@@ -185,23 +219,28 @@ class TestExtractTransactions:
 
     @pytest.mark.integration
     @pytest.mark.file_operations
-    def test_large_file_handling(self, tmp_path):
+    @pytest.mark.parametrize("n", [
+        1000,
+        pytest.param(100_000, marks=pytest.mark.slow),
+    ], ids=["1k_rows", "100k_rows"])
+    def test_large_file_handling(self, tmp_path, write_csv, n):
         """Test extraction of a larger CSV file."""
-        # Create a larger dataset
+        # Create a larger dataset directly from NumPy buffers
+        row_numbers = np.arange(n)
         large_data = pd.DataFrame({
-            "transaction_id": [f"TXN{i:06d}" for i in range(1000)],
-            "date": ["2023-01-01"] * 1000,
-            "category": ["Food"] * 1000,
-            "amount": [10.0 + i * 0.1 for i in range(1000)],
-            "merchant": ["Store A"] * 1000,
-            "payment_method": ["Credit Card"] * 1000,
-            "user_id": [i % 100 for i in range(1000)]
+            "transaction_id": np.char.add("TXN", np.char.zfill(row_numbers.astype(str), 6)),
+            "date": np.full(n, "2023-01-01"),
+            "category": np.full(n, "Food"),
+            "amount": 10.0 + row_numbers * 0.1,
+            "merchant": np.full(n, "Store A"),
+            "payment_method": np.full(n, "Credit Card"),
+            "user_id": row_numbers % 100
         })
 
         csv_file = tmp_path / "large_transactions.csv"
-        large_data.to_csv(csv_file, index=False)
+        write_csv(large_data, csv_file)
 
         df_extracted = extract_transactions(str(csv_file))
 
-        assert len(df_extracted) == 1000
-        assert df_extracted["transaction_id"].nunique() == 1000
+        assert len(df_extracted) == n
+        assert df_extracted["transaction_id"].nunique() == n
@@ -20,6 +20,7 @@ from src.load import (
     enrich_fact_with_keys,
     check_existing_transactions,
     load_fact_table,
+    load_fact_table_stream,
     load_data_warehouse,
     DatabaseConnectionError,
     DimensionLoadError,
@@ -74,44 +75,47 @@ class TestDatabaseConnectionContextManager:
 
 
 # ============================================================================
-# Dimension Loading Tests (4 tests)
+# Dimension Loading Tests (5 tests)
 # ============================================================================
 
 class TestLoadDimension:
-    """Tests for generic dimension loading."""
+    """Tests for dimension loading (generic dimensions and dim_date)."""
 
     @pytest.mark.unit
-    def test_load_dimension_new_records(self, mock_db_connection, mock_cursor, dimension_dataframes):
-        """Test loading new dimension records successfully."""
-        # Setup: cursor returns count before (0) and after (3) insertion
-        mock_cursor.fetchone.side_effect = [(0,), (3,)]
-
-        with patch('src.load.execute_batch'):
-            count = load_dimension(
-                mock_db_connection,
-                dimension_dataframes["category"],
-                "dim_category",
-                "category_name"
-            )
-
-        assert count == 3
-        assert mock_cursor.execute.called
+    @pytest.mark.parametrize("rowcount,dim_name,loader,loader_args", [
+        (3, "category", load_dimension, ("dim_category", "category_name")),
+        (0, "category", load_dimension, ("dim_category", "category_name")),
+        (3, "date", load_dim_date, ()),
+    ], ids=["new_records", "skip_existing", "dim_date_all_attributes"])
+    def test_inserted_count(self, rowcount, dim_name, loader, loader_args,
+                            mock_db_connection, mock_cursor, dimension_dataframes):
+        """Test inserted count comes from the INSERT itself (ON CONFLICT skips existing)."""
+        # Setup: INSERT ... SELECT from staging reports rowcount rows inserted
+        mock_cursor.rowcount = rowcount
+
+        count = loader(mock_db_connection, getattr(dimension_dataframes, dim_name), *loader_args)
+
+        assert count == rowcount
+        assert mock_cursor.copy_expert.called
+        assert not mock_cursor.fetchone.called
 
     @pytest.mark.unit
-    def test_load_dimension_skip_existing(self, mock_db_connection, mock_cursor, dimension_dataframes):
-        """Test ON CONFLICT behavior skips existing records."""
-        # Setup: cursor returns same count before and after (no new records)
-        mock_cursor.fetchone.side_effect = [(3,), (3,)]
-
-        with patch('src.load.execute_batch'):
-            count = load_dimension(
-                mock_db_connection,
-                dimension_dataframes["category"],
-                "dim_category",
-                "category_name"
-            )
+    def test_load_dimension_execute_values_method(self, mock_db_connection, mock_cursor, dimension_dataframes):
+        """Test LOAD_METHOD='values' inserts with execute_values instead of COPY."""
+        with patch('src.load.LOAD_METHOD', 'values'):
+            with patch('src.load.execute_values', return_value=[(1,)] * 3) as mock_execute_values:
+                count = load_dimension(
+                    mock_db_connection,
+                    dimension_dataframes.category,
+                    "dim_category",
+                    "category_name"
+                )
 
-        assert count == 0
+        assert count == 3
+        assert mock_execute_values.called
+        assert not mock_cursor.copy_expert.called
+        records = list(mock_execute_values.call_args[0][2])
+        assert records == [("Groceries",), ("Dining",), ("Transportation",)]
 
     @pytest.mark.unit
     def test_load_dimension_empty_dataframe(self, mock_db_connection, empty_dataframe):
@@ -126,27 +130,8 @@ class TestLoadDimension:
         assert count == 0
 
 
-class TestLoadDimDate:
-    """Tests for date dimension loading."""
-
-    @pytest.mark.unit
-    def test_load_dim_date_with_all_attributes(self, mock_db_connection, mock_cursor, dimension_dataframes):
-        """Test loading date dimension with all 11 attributes."""
-        # Setup: cursor returns count before (0) and after (3) insertion
-        mock_cursor.fetchone.side_effect = [(0,), (3,)]
-
-        with patch('src.load.execute_batch'):
-            count = load_dim_date(
-                mock_db_connection,
-                dimension_dataframes["date"]
-            )
-
-        assert count == 3
-        assert mock_cursor.execute.called
-
-
 # ============================================================================
-# Dimension Key Mapping Tests (2 tests)
+# Dimension Key Mapping Tests (3 tests)
 # ============================================================================
 
 class TestGetDimensionKeyMapping:
@@ -197,10 +182,33 @@ class TestGetAllDimensionMappings:
             assert "user" in mappings
             assert "date" in mappings
             assert len(mappings) == 5
+            # One query per dimension and no other round-trips
+            assert mock_get_mapping.call_count == 5
+            assert not mock_db_connection.cursor.called
+
+    @pytest.mark.unit
+    def test_integer_mappings_returned_as_sorted_arrays(self, mock_db_connection):
+        """Test user and date mappings come back as sorted int64 lookup arrays."""
+        with patch('src.load.get_dimension_key_mapping') as mock_get_mapping:
+            mock_get_mapping.side_effect = [
+                {"Groceries": 1},
+                {"Whole Foods": 1},
+                {"Credit Card": 1},
+                {3: 30, 1: 10, 2: 20},
+                {20230616: 20230616, 20230615: 20230615}
+            ]
+
+            mappings = get_all_dimension_mappings(mock_db_connection)
+
+        assert mappings["category"] == {"Groceries": 1}
+        user_ids, user_keys = mappings["user"]
+        assert user_ids.tolist() == [1, 2, 3]
+        assert user_keys.tolist() == [10, 20, 30]
+        assert mappings["date"][0].tolist() == [20230615, 20230616]
 
 
 # ============================================================================
-# Fact Enrichment Tests (5 tests)
+# Fact Enrichment Tests (9 tests)
 # ============================================================================
 
 class TestEnrichFactWithKeys:
@@ -231,6 +239,86 @@ class TestEnrichFactWithKeys:
         assert enriched["category_key"].tolist() == [1, 2]
         assert enriched["merchant_key"].tolist() == [1, 2]
 
+        # Verify keys are narrowed to the schema's INTEGER width
+        key_columns = ["date_key", "category_key", "merchant_key", "payment_method_key", "user_key"]
+        assert (enriched[key_columns].dtypes == "int32").all()
+
+    @pytest.mark.unit
+    def test_enrich_fact_with_non_sequential_keys(self, dimension_mappings):
+        """Test lookup uses surrogate key values, not positions in the mapping."""
+        mappings = {**dimension_mappings, "category": {"Groceries": 17, "Dining": 5}}
+        fact_df = pd.DataFrame({
+            "transaction_id": ["TXN001", "TXN002", "TXN003"],
+            "date_key": [20230615, 20230616, 20230617],
+            "category": ["Dining", "Groceries", "Dining"],
+            "merchant": ["Whole Foods", "Starbucks", "Uber"],
+            "payment_method": ["Credit Card", "Debit Card", "Digital Wallet"],
+            "user_id": [3, 1, 2],
+            "amount": [50.00, 35.50, 15.75]
+        })
+
+        enriched = enrich_fact_with_keys(fact_df, mappings)
+
+        assert enriched["category_key"].tolist() == [5, 17, 5]
+        assert enriched["user_key"].tolist() == [3, 1, 2]
+        assert enriched["category_key"].dtype == "int32"
+
+    @pytest.mark.unit
+    def test_enrich_fact_with_array_mappings(self, dimension_mappings, dimension_mappings_arrays):
+        """Test sorted-array mappings produce the same keys as dict mappings."""
+        fact_df = pd.DataFrame({
+            "transaction_id": ["TXN001", "TXN002", "TXN003"],
+            "date_key": [20230617, 20230615, 20230616],
+            "category": ["Transportation", "Groceries", "Dining"],
+            "merchant": ["Uber", "Whole Foods", "Starbucks"],
+            "payment_method": ["Digital Wallet", "Credit Card", "Debit Card"],
+            "user_id": [3, 1, 2],
+            "amount": [50.00, 35.50, 15.75]
+        })
+
+        from_dicts = enrich_fact_with_keys(fact_df, dimension_mappings)
+        from_arrays = enrich_fact_with_keys(fact_df, dimension_mappings_arrays)
+
+        pd.testing.assert_frame_equal(from_arrays, from_dicts)
+
+    @pytest.mark.unit
+    def test_enrich_fact_with_categorical_columns(self, dimension_mappings):
+        """Test categorical natural keys resolve per category and match plain text."""
+        fact_df = pd.DataFrame({
+            "transaction_id": ["TXN001", "TXN002", "TXN003"],
+            "date_key": [20230617, 20230615, 20230616],
+            "category": ["Transportation", "Groceries", "Transportation"],
+            "merchant": pd.Categorical(["Uber", "Whole Foods", "Uber"], categories=["Uber", "Whole Foods", "Unused"]),
+            "payment_method": ["Digital Wallet", "Credit Card", "Debit Card"],
+            "user_id": [3, 1, 2],
+            "amount": [50.00, 35.50, 15.75]
+        })
+
+        enriched = enrich_fact_with_keys(fact_df, dimension_mappings)
+        enriched_text = enrich_fact_with_keys(fact_df.astype({"merchant": str}), dimension_mappings)
+
+        assert enriched["merchant_key"].tolist() == [3, 1, 3]
+        assert enriched["merchant_key"].tolist() == enriched_text["merchant_key"].tolist()
+
+    @pytest.mark.unit
+    @pytest.mark.error_handling
+    @pytest.mark.validation
+    def test_enrich_fact_array_mappings_missing_key(self, dimension_mappings_arrays):
+        """Test FactLoadError raised for unmapped keys with sorted-array mappings."""
+        fact_df = pd.DataFrame({
+            "transaction_id": ["TXN001"],
+            "date_key": [20230615],
+            "category": ["Groceries"],
+            "merchant": ["Zzz Unknown"],  # Sorts past every known merchant
+            "payment_method": ["Credit Card"],
+            "user_id": [1],
+            "amount": [50.00]
+        })
+
+        with pytest.raises(FactLoadError) as exc_info:
+            enrich_fact_with_keys(fact_df, dimension_mappings_arrays)
+        assert "merchant" in str(exc_info.value).lower()
+
     @pytest.mark.unit
     @pytest.mark.error_handling
     @pytest.mark.validation
@@ -309,20 +397,17 @@ class TestEnrichFactWithKeys:
 
 
 # ============================================================================
-# Fact Loading Tests (3 tests)
+# Fact Loading Tests (8 tests)
 # ============================================================================
 
 class TestCheckExistingTransactions:
     """Tests for checking existing transactions."""
 
     @pytest.mark.unit
-    def test_check_existing_transactions(self, mock_db_connection, mock_cursor):
+    def test_check_existing_transactions(self, mock_db_connection, mock_cursor, seq):
         """Test returns set of existing transaction IDs."""
-        # Setup: cursor returns existing transaction IDs
-        mock_cursor.fetchall.return_value = [
-            ("TXN001",),
-            ("TXN002",)
-        ]
+        # Setup: server-side cursor streams existing IDs in two batches, then ends
+        mock_cursor.fetchmany = seq([("TXN001",)], [("TXN002",)], [])
 
         existing = check_existing_transactions(
             mock_db_connection,
@@ -331,6 +416,23 @@ class TestCheckExistingTransactions:
 
         assert existing == {"TXN001", "TXN002"}
         assert "TXN003" not in existing
+        assert mock_cursor.copy_expert.called
+        mock_db_connection.cursor.assert_any_call(name="existing_transaction_ids")
+
+    @pytest.mark.unit
+    def test_check_existing_transactions_autocommit(self, mock_db_connection, mock_cursor, seq):
+        """Test autocommit connections use a client-side cursor and clear leftover staging tables."""
+        mock_db_connection.autocommit = True
+        mock_cursor.fetchmany = seq([("TXN001",)], [])
+
+        existing = check_existing_transactions(mock_db_connection, ["TXN001", "TXN002"])
+
+        assert existing == {"TXN001"}
+        # Named (server-side) cursors are rejected outside a transaction
+        assert all(call.kwargs == {} for call in mock_db_connection.cursor.call_args_list)
+        statements = [call.args[0].strip() for call in mock_cursor.execute.call_args_list]
+        assert statements[0] == "DROP TABLE IF EXISTS incoming_transaction_ids"
+        assert statements[1].startswith("CREATE TEMP TABLE incoming_transaction_ids")
 
 
 class TestLoadFactTable:
@@ -339,40 +441,104 @@ class TestLoadFactTable:
     @pytest.mark.unit
     def test_load_fact_table_all_new(self, mock_db_connection, mock_cursor, enriched_fact_data):
         """Test loading all new transactions."""
-        # Setup: no existing transactions, cursor returns count before (0) and after (3)
-        mock_cursor.fetchone.side_effect = [(0,), (3,)]
+        # Setup: no existing transactions, INSERT ... SELECT reports 3 rows inserted
+        mock_cursor.rowcount = 3
 
         with patch('src.load.check_existing_transactions', return_value=set()):
-            with patch('src.load.execute_batch'):
-                inserted, skipped = load_fact_table(
-                    mock_db_connection,
-                    enriched_fact_data
-                )
+            inserted, skipped = load_fact_table(
+                mock_db_connection,
+                enriched_fact_data
+            )
 
         assert inserted == 3
         assert skipped == 0
+        assert mock_cursor.copy_expert.called
+        assert not mock_cursor.fetchone.called
+
+    @pytest.mark.unit
+    def test_load_fact_table_values_counts_returning_rows(self, mock_db_connection, mock_cursor, enriched_fact_data):
+        """Test LOAD_METHOD='values' counts inserts from INSERT ... RETURNING rows."""
+        with patch('src.load.LOAD_METHOD', 'values'):
+            with patch('src.load.check_existing_transactions', return_value=set()):
+                with patch('src.load.execute_values', return_value=[(1,), (1,)]) as mock_execute_values:
+                    inserted, skipped = load_fact_table(mock_db_connection, enriched_fact_data)
+
+        insert_query = mock_execute_values.call_args.args[1]
+        assert "RETURNING 1" in insert_query
+        assert mock_execute_values.call_args.kwargs["fetch"] is True
+        assert inserted == 2
+        assert skipped == 1
 
     @pytest.mark.unit
     def test_load_fact_table_skip_existing(self, mock_db_connection, mock_cursor, enriched_fact_data, existing_transaction_ids):
         """Test incremental load skips existing transactions."""
         # Setup: TXN001 and TXN002 already exist, only 1 new record inserted
-        mock_cursor.fetchone.side_effect = [(0,), (1,)]
+        mock_cursor.rowcount = 1
 
         with patch('src.load.check_existing_transactions', return_value=existing_transaction_ids):
-            with patch('src.load.execute_batch'):
-                inserted, skipped = load_fact_table(
-                    mock_db_connection,
-                    enriched_fact_data
-                )
+            inserted, skipped = load_fact_table(
+                mock_db_connection,
+                enriched_fact_data
+            )
 
         assert inserted == 1
         assert skipped == 2
 
+    @pytest.mark.unit
+    def test_load_fact_deduplicates_within_batch(self, mock_db_connection, mock_cursor, enriched_fact_data):
+        """Test duplicate transaction_ids in a batch collapse to their first row before loading."""
+        fact_with_duplicate = pd.concat(
+            [enriched_fact_data, enriched_fact_data.iloc[[0]].assign(amount=99.99)],
+            ignore_index=True
+        )
+        with patch('src.load.check_existing_transactions', return_value=set()) as mock_check:
+            with patch('src.load._bulk_insert', return_value=3) as mock_bulk_insert:
+                inserted, skipped = load_fact_table(mock_db_connection, fact_with_duplicate)
+
+        loaded_df = mock_bulk_insert.call_args.args[1]
+        assert loaded_df['transaction_id'].is_unique
+        assert len(loaded_df) == 3
+        first_id = enriched_fact_data['transaction_id'][0]
+        assert loaded_df.loc[loaded_df['transaction_id'] == first_id, 'amount'].item() == enriched_fact_data['amount'][0]
+        assert len(mock_check.call_args.args[1]) == 3
+        assert inserted == 3
+        assert skipped == 1
+
+
+class TestLoadFactTableStream:
+    """Tests for streaming fact loads from Arrow record batches."""
+
+    @pytest.mark.unit
+    def test_load_fact_table_stream_copies_each_batch(self, mock_db_connection, mock_cursor,
+                                                      enriched_fact_batches):
+        """Test every record batch is COPYed into staging before one INSERT."""
+        # Setup: INSERT ... SELECT reports 2 of the 3 staged rows inserted
+        mock_cursor.rowcount = 2
+
+        inserted, skipped = load_fact_table_stream(mock_db_connection, iter(enriched_fact_batches))
+
+        assert inserted == 2
+        assert skipped == 1
+        assert not mock_cursor.fetchone.called
+        assert mock_cursor.copy_expert.call_count == len(enriched_fact_batches)
+
+        staged_csv = b"".join(call.args[1].getvalue() for call in mock_cursor.copy_expert.call_args_list)
+        assert staged_csv.count(b"TXN") == 3
+
+    @pytest.mark.unit
+    def test_load_fact_table_stream_database_error(self, mock_db_connection, mock_cursor, enriched_fact_batches):
+        """Test database errors are wrapped in FactLoadError."""
+        mock_cursor.copy_expert.side_effect = psycopg2.Error("COPY failed")
+
+        with pytest.raises(FactLoadError, match="Failed to stream fact table"):
+            load_fact_table_stream(mock_db_connection, enriched_fact_batches)
+
 
 # ============================================================================
-# End-to-End Integration Tests (3 tests)
+# End-to-End Integration Tests (5 tests)
 # ============================================================================
 
+@pytest.mark.xdist_group("load_dw")
 class TestLoadDataWarehouse:
     """Tests for end-to-end data warehouse loading."""
 
@@ -380,11 +546,11 @@ class TestLoadDataWarehouse:
     def test_load_data_warehouse_success(self, mock_db_connection, mock_cursor, dimension_dataframes):
         """Test complete successful load of all dimensions and fact table."""
         transformed_data = {
-            "dim_category": dimension_dataframes["category"],
-            "dim_merchant": dimension_dataframes["merchant"],
-            "dim_payment_method": dimension_dataframes["payment_method"],
-            "dim_user": dimension_dataframes["user"],
-            "dim_date": dimension_dataframes["date"],
+            "dim_category": dimension_dataframes.category,
+            "dim_merchant": dimension_dataframes.merchant,
+            "dim_payment_method": dimension_dataframes.payment_method,
+            "dim_user": dimension_dataframes.user,
+            "dim_date": dimension_dataframes.date,
             "fact_data": pd.DataFrame({
                 "transaction_id": ["TXN001"],
                 "date_key": [20230615],
@@ -419,11 +585,11 @@ class TestLoadDataWarehouse:
     def test_load_data_warehouse_incremental(self, mock_db_connection, dimension_dataframes):
         """Test incremental loading - run twice, second run skips duplicates."""
         transformed_data = {
-            "dim_category": dimension_dataframes["category"],
-            "dim_merchant": dimension_dataframes["merchant"],
-            "dim_payment_method": dimension_dataframes["payment_method"],
-            "dim_user": dimension_dataframes["user"],
-            "dim_date": dimension_dataframes["date"],
+            "dim_category": dimension_dataframes.category,
+            "dim_merchant": dimension_dataframes.merchant,
+            "dim_payment_method": dimension_dataframes.payment_method,
+            "dim_user": dimension_dataframes.user,
+            "dim_date": dimension_dataframes.date,
             "fact_data": pd.DataFrame({
                 "transaction_id": ["TXN001"],
                 "date_key": [20230615],
@@ -468,11 +634,11 @@ class TestLoadDataWarehouse:
     def test_load_data_warehouse_rollback_on_error(self, mock_db_connection, dimension_dataframes):
         """Test transaction atomicity - rollback on error."""
         transformed_data = {
-            "dim_category": dimension_dataframes["category"],
-            "dim_merchant": dimension_dataframes["merchant"],
-            "dim_payment_method": dimension_dataframes["payment_method"],
-            "dim_user": dimension_dataframes["user"],
-            "dim_date": dimension_dataframes["date"],
+            "dim_category": dimension_dataframes.category,
+            "dim_merchant": dimension_dataframes.merchant,
+            "dim_payment_method": dimension_dataframes.payment_method,
+            "dim_user": dimension_dataframes.user,
+            "dim_date": dimension_dataframes.date,
             "fact_data": pd.DataFrame({
                 "transaction_id": ["TXN001"],
                 "date_key": [20230615],
@@ -495,3 +661,68 @@ class TestLoadDataWarehouse:
         mock_db_connection.rollback.assert_called()
         # Verify connection was closed
         mock_db_connection.close.assert_called()
+
+    @pytest.mark.integration
+    def test_load_data_warehouse_concurrent_dimensions(self, mock_db_connection, dimension_dataframes):
+        """Test dimensions load on their own committed connections when workers > 1."""
+        transformed_data = {
+            "dim_category": dimension_dataframes.category,
+            "dim_merchant": dimension_dataframes.merchant,
+            "dim_payment_method": dimension_dataframes.payment_method,
+            "dim_user": dimension_dataframes.user,
+            "dim_date": dimension_dataframes.date,
+            "fact_data": pd.DataFrame({
+                "transaction_id": ["TXN001"],
+                "date_key": [20230615],
+                "category": ["Groceries"],
+                "merchant": ["Whole Foods"],
+                "payment_method": ["Credit Card"],
+                "user_id": [1],
+                "amount": [50.00]
+            })
+        }
+
+        with patch('src.load.DIMENSION_LOAD_WORKERS', 5):
+            with patch('src.load.get_db_connection', return_value=mock_db_connection) as mock_connect:
+                with patch('src.load.load_dimension', return_value=3) as mock_load_dimension:
+                    with patch('src.load.load_dim_date', return_value=2):
+                        with patch('src.load.get_all_dimension_mappings', return_value={}):
+                            with patch('src.load.enrich_fact_with_keys', return_value=transformed_data["fact_data"]):
+                                with patch('src.load.load_fact_table', return_value=(1, 0)):
+                                    stats = load_data_warehouse(transformed_data)
+
+        assert stats["dimensions_inserted"] == {
+            "dim_date": 2,
+            "dim_category": 3,
+            "dim_merchant": 3,
+            "dim_payment_method": 3,
+            "dim_user": 3,
+        }
+        assert mock_load_dimension.call_count == 4
+        # One connection per dimension plus the main fact-load connection
+        assert mock_connect.call_count == 6
+        assert mock_db_connection.commit.call_count == 6
+
+    @pytest.mark.integration
+    @pytest.mark.error_handling
+    def test_load_data_warehouse_concurrent_dimension_failure(self, mock_db_connection, dimension_dataframes):
+        """Test a failing concurrent dimension load aborts the warehouse load."""
+        transformed_data = {
+            "dim_category": dimension_dataframes.category,
+            "dim_merchant": dimension_dataframes.merchant,
+            "dim_payment_method": dimension_dataframes.payment_method,
+            "dim_user": dimension_dataframes.user,
+            "dim_date": dimension_dataframes.date,
+            "fact_data": pd.DataFrame()
+        }
+
+        with patch('src.load.DIMENSION_LOAD_WORKERS', 5):
+            with patch('src.load.get_db_connection', return_value=mock_db_connection):
+                with patch('src.load.load_dimension', side_effect=DimensionLoadError("Load failed")):
+                    with patch('src.load.load_dim_date', return_value=2):
+                        with patch('src.load.load_fact_table') as mock_load_fact:
+                            with pytest.raises(DimensionLoadError):
+                                load_data_warehouse(transformed_data)
+
+        assert not mock_load_fact.called
+        assert mock_db_connection.rollback.called
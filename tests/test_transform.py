@@ -14,19 +14,25 @@ import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from src.transform import (
     standardize_category,
     standardize_merchant,
     standardize_payment_method,
+    _standardize_category_series,
+    _standardize_merchant_series,
+    _standardize_payment_method_series,
     clean_transaction_data,
     validate_transaction_data,
     derive_date_attributes,
     create_dimension_data,
     log_transformation_summary,
     transform_transactions,
+    _pipeline,
     ALLOWED_CATEGORIES,
     ALLOWED_PAYMENT_METHODS,
+    TEXT_DTYPE,
     MIN_VALID_DATE,
     MAX_VALID_DATE,
     MIN_AMOUNT,
@@ -104,6 +110,37 @@ class TestStandardizationFunctions:
         result = standardize_payment_method(np.nan)
         assert pd.isna(result)
 
+    @pytest.mark.unit
+    @pytest.mark.validation
+    @pytest.mark.parametrize("scalar_func,series_func", [
+        (standardize_category, _standardize_category_series),
+        (standardize_merchant, _standardize_merchant_series),
+        (standardize_payment_method, _standardize_payment_method_series),
+    ], ids=["category", "merchant", "payment_method"])
+    def test_series_matches_scalar(self, scalar_func, series_func):
+        """Test vectorized standardizers agree with their scalar counterparts."""
+        raw = pd.Series(["  groceries  ", "WALMART   SUPERCENTER", "credit\tcard", np.nan, 42], dtype=object)
+
+        result = series_func(raw)
+
+        for actual, value in zip(result, raw):
+            expected = scalar_func(value)
+            if pd.isna(expected):
+                assert pd.isna(actual)
+            else:
+                assert actual == expected
+
+    @pytest.mark.unit
+    def test_series_keeps_text_dtype(self):
+        """Test Arrow-backed text is standardized without a round-trip through object strings."""
+        raw = pd.Series(["  whole   foods  ", np.nan], dtype=TEXT_DTYPE)
+
+        result = _standardize_merchant_series(raw)
+
+        assert result.dtype == TEXT_DTYPE
+        assert result.iloc[0] == "Whole Foods"
+        assert pd.isna(result.iloc[1])
+
 
 # ============================================================================
 # Tests for clean_transaction_data Function
@@ -210,12 +247,14 @@ class TestValidateTransactionData:
 
     @pytest.mark.unit
     @pytest.mark.validation
-    def test_all_valid_data(self, clean_transform_data):
+    def test_all_valid_data(self, clean_transform_data, allowed_categories, allowed_payment_methods):
         """Test validation of completely valid data."""
         valid_df, issues = validate_transaction_data(clean_transform_data)
 
         assert len(valid_df) == len(clean_transform_data)
         assert len(issues) == 0
+        assert valid_df['category'].isin(allowed_categories).all()
+        assert valid_df['payment_method'].isin(allowed_payment_methods).all()
 
     @pytest.mark.unit
     @pytest.mark.validation
@@ -240,6 +279,25 @@ class TestValidateTransactionData:
         # Should have issues reported
         assert len(issues) > 0
 
+    @pytest.mark.unit
+    @pytest.mark.validation
+    def test_amount_bounds_are_inclusive(self):
+        """Test MIN_AMOUNT and MAX_AMOUNT are accepted and sub-cent amounts rejected."""
+        df = pd.DataFrame({
+            "transaction_id": ["TXN001", "TXN002", "TXN003"],
+            "date": ["2023-06-15"] * 3,
+            "category": ["Groceries"] * 3,
+            "amount": [MIN_AMOUNT, MAX_AMOUNT, 0.004],
+            "merchant": ["Store A"] * 3,
+            "payment_method": ["Credit Card"] * 3,
+            "user_id": [1, 2, 3]
+        })
+
+        valid_df, issues = validate_transaction_data(df)
+
+        assert valid_df['transaction_id'].tolist() == ["TXN001", "TXN002"]
+        assert len(issues) == 1
+
     @pytest.mark.unit
     @pytest.mark.validation
     def test_filters_future_dates(self):
@@ -262,6 +320,37 @@ class TestValidateTransactionData:
         assert len(valid_df) == 1
         assert any("future" in issue.lower() for issue in issues)
 
+    @pytest.mark.unit
+    @pytest.mark.validation
+    def test_categorical_inputs_match_text_inputs(self, invalid_transform_data):
+        """Test categorical category/payment columns validate exactly like text columns."""
+        as_categorical = invalid_transform_data.astype({"category": "category", "payment_method": "category"})
+
+        text_df, text_issues = validate_transaction_data(invalid_transform_data)
+        categorical_df, categorical_issues = validate_transaction_data(as_categorical)
+
+        pd.testing.assert_frame_equal(categorical_df, text_df)
+        assert categorical_issues == text_issues
+
+    @pytest.mark.unit
+    @pytest.mark.validation
+    def test_parses_non_iso_dates_via_fallback(self):
+        """Test dates outside the ISO format are re-parsed and unparseable ones flagged."""
+        df = pd.DataFrame({
+            "transaction_id": ["TXN001", "TXN002", "TXN003"],
+            "date": ["2023-06-15", "06/16/2023", "not-a-date"],
+            "category": ["Groceries", "Dining", "Travel"],
+            "amount": [50.00, 30.00, 20.00],
+            "merchant": ["Store A", "Store B", "Store C"],
+            "payment_method": ["Credit Card", "Cash", "Cash"],
+            "user_id": [1, 2, 3]
+        })
+
+        valid_df, issues = validate_transaction_data(df)
+
+        assert valid_df['date'].tolist() == [pd.Timestamp("2023-06-15"), pd.Timestamp("2023-06-16")]
+        assert any("invalid date format" in issue for issue in issues)
+
     @pytest.mark.unit
     @pytest.mark.validation
     def test_filters_old_dates(self):
@@ -505,8 +594,7 @@ class TestDeriveDateAttributes:
         date_dim = derive_date_attributes(sample_date_series)
 
         # Verify sorted
-        dates = date_dim['date'].tolist()
-        assert dates == sorted(dates)
+        assert date_dim['date'].is_monotonic_increasing
 
 
 # ============================================================================
@@ -591,20 +679,16 @@ class TestCreateDimensionData:
         dimensions = create_dimension_data(validated_transform_data)
 
         # Check category is sorted
-        categories = dimensions['dim_category']['category_name'].tolist()
-        assert categories == sorted(categories)
+        assert dimensions['dim_category']['category_name'].is_monotonic_increasing
 
         # Check merchants are sorted
-        merchants = dimensions['dim_merchant']['merchant_name'].tolist()
-        assert merchants == sorted(merchants)
+        assert dimensions['dim_merchant']['merchant_name'].is_monotonic_increasing
 
         # Check payment methods are sorted
-        payments = dimensions['dim_payment_method']['payment_method_name'].tolist()
-        assert payments == sorted(payments)
+        assert dimensions['dim_payment_method']['payment_method_name'].is_monotonic_increasing
 
         # Check users are sorted
-        users = dimensions['dim_user']['user_id'].tolist()
-        assert users == sorted(users)
+        assert dimensions['dim_user']['user_id'].is_monotonic_increasing
 
     @pytest.mark.unit
     @pytest.mark.validation
@@ -670,6 +754,25 @@ class TestLogTransformationSummary:
             issues=issues
         )
 
+    @pytest.mark.unit
+    def test_issues_logged_as_one_record(self):
+        """Test all issues are emitted in a single warning record."""
+        issues = [f"Issue {i}" for i in range(100)]
+
+        with patch('src.transform.logger') as mock_logger:
+            log_transformation_summary(
+                original_count=1000,
+                final_count=500,
+                duplicates_removed=200,
+                invalid_removed=300,
+                issues=issues
+            )
+
+        assert mock_logger.warning.call_count == 1
+        message = mock_logger.warning.call_args.args[0]
+        assert message.startswith("Total data quality issues found: 100")
+        assert "  100. Issue 99" in message
+
 
 # ============================================================================
 # Tests for transform_transactions Function (Main Pipeline)
@@ -745,6 +848,58 @@ class TestTransformTransactions:
         with pytest.raises(ValueError, match=r"No valid records"):
             transform_transactions(df)
 
+    @pytest.mark.integration
+    @pytest.mark.error_handling
+    def test_all_invalid_amounts_skip_categorical_checks(self):
+        """Test an all-invalid batch stops validation before the categorical encodings."""
+        df = pd.DataFrame({
+            "transaction_id": ["TXN001", "TXN002"],
+            "date": ["2023-06-15", "2023-06-16"],
+            "category": ["Groceries", "Dining"],
+            "amount": [-10.00, 0.00],  # Every amount below MIN_AMOUNT
+            "merchant": ["Store A", "Store B"],
+            "payment_method": ["Credit Card", "Cash"],
+            "user_id": [1, 2]
+        })
+
+        with patch('src.transform._to_allowed_categorical') as mock_encode:
+            with pytest.raises(ValueError, match=r"No valid records"):
+                transform_transactions(df)
+
+        assert not mock_encode.called
+
+    @pytest.mark.integration
+    def test_time_bearing_fallback_dates_share_date_key(self):
+        """Test a mixed-format date with a time of day maps to one dim_date row with its ISO twin."""
+        df = pd.DataFrame({
+            "transaction_id": ["TXN001", "TXN002", "TXN003"],
+            "date": ["2023-06-15", "06/15/2023 14:30", "2023-06-15 09:05:00"],
+            "category": ["Groceries", "Dining", "Groceries"],
+            "amount": [50.00, 30.00, 20.00],
+            "merchant": ["Store A", "Store B", "Store C"],
+            "payment_method": ["Credit Card", "Cash", "Cash"],
+            "user_id": [1, 2, 3]
+        })
+
+        result = transform_transactions(df)
+
+        assert result['fact_data']['date'].tolist() == [pd.Timestamp("2023-06-15")] * 3
+        assert result['fact_data']['date_key'].tolist() == [20230615] * 3
+        assert result['dim_date']['date_key'].tolist() == [20230615]
+
+    @pytest.mark.integration
+    def test_fused_pass_matches_separate_stages(self, dirty_transform_data):
+        """Test the fused pipeline yields the same rows and issues as clean then validate."""
+        df = dirty_transform_data.copy()
+        df.loc[2, 'amount'] = -5.00  # Invalid amount on the dropped duplicate row
+
+        staged_df, staged_issues = validate_transaction_data(clean_transaction_data(df))
+        fused_df, fused_issues, duplicates_removed = _pipeline(df)
+
+        pd.testing.assert_frame_equal(fused_df, staged_df)
+        assert fused_issues == staged_issues == []
+        assert duplicates_removed == 1
+
     @pytest.mark.integration
     def test_handles_dirty_data(self, dirty_transform_data):
         """Test transformation of dirty data with duplicates and formatting issues."""